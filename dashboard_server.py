@@ -1,25 +1,26 @@
-import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+"""
+Standalone runner for the DALS dashboard.
+
+The dashboard normally runs inside the CALEON ISS API process and is served at
+/dashboard on its port. Set DALS_DASHBOARD_STANDALONE=1 to run it as its own
+server instead (DALS_DASHBOARD_HOST / DALS_DASHBOARD_PORT, default 127.0.0.1:8007).
 
-app = FastAPI(title="DALS Dashboard")
+8007 is used by nothing else in DALS: 8005 is the CALEON ISS API, 8006 is
+cochlear processor 2, and the other CALEON modules sit on 8001 and 8010-8044.
+"""
 
-# Setup templates
-templates_dir = Path(__file__).parent / "iss_module" / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+import os
+import sys
 
-@app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Serve the DALS dashboard"""
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+import uvicorn
 
-@app.get("/health")
-async def health():
-    """Health check"""
-    return {"status": "healthy", "service": "dals-dashboard"}
+from iss_module.api.dashboard import app
 
 if __name__ == "__main__":
-    print("🚀 Starting DALS Dashboard on http://127.0.0.1:8005")
-    uvicorn.run(app, host="127.0.0.1", port=8005, log_level="info")
\ No newline at end of file
+    if os.environ.get("DALS_DASHBOARD_STANDALONE") != "1":
+        sys.exit("The DALS dashboard is served by the CALEON ISS API at /dashboard; "
+                 "set DALS_DASHBOARD_STANDALONE=1 to run it on its own")
+    host = os.environ.get("DALS_DASHBOARD_HOST", "127.0.0.1")
+    port = int(os.environ.get("DALS_DASHBOARD_PORT", "8007"))
+    print(f"🚀 Starting DALS Dashboard on http://{host}:{port}")
+    uvicorn.run(app, host=host, port=port, log_level="info")
@@ -55,40 +55,36 @@ __version__ = "1.0.0"
 __author__ = "ISS Development Team"
 __email__ = "iss@enterprise.starfleet"
 
-# Core imports for easy access
-from iss_module.core.ISS import ISS
-from iss_module.inventory.inventory_manager import CaptainLog
-from iss_module.inventory.exporters import DataExporter as Exporters
-from iss_module.core.utils import get_stardate, current_timecodes
-
-# Prometheus Prime integration (optional import)
-try:
-    from iss_module.prometheus_integration import (
-        PrometheusISS,
-        create_prometheus_iss_app,
-        ReasoningRequest,
-        ReasoningResponse
-    )
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
-
-# Configuration
-try:
-    from iss_module.config import settings
-    CONFIG_AVAILABLE = True
-except ImportError:
-    CONFIG_AVAILABLE = False
-
-# Structured logging
-try:
-    from iss_module.logging_config import get_logger, configure_structured_logging
-    LOGGING_AVAILABLE = True
-except ImportError:
-    LOGGING_AVAILABLE = False
+import importlib
+
+# Public names are imported on first access (PEP 562) so that importing a
+# submodule such as iss_module.cli doesn't pull in FastAPI, pydantic and the
+# rest of the package. Values: (module, attribute)
+_LAZY_ATTRS = {
+    'ISS': ('iss_module.core.ISS', 'ISS'),
+    'CaptainLog': ('iss_module.inventory.inventory_manager', 'CaptainLog'),
+    'Exporters': ('iss_module.inventory.exporters', 'DataExporter'),
+    'get_stardate': ('iss_module.core.utils', 'get_stardate'),
+    'current_timecodes': ('iss_module.core.utils', 'current_timecodes'),
+}
+
+# Optional components: availability flag -> (module, names it provides)
+_OPTIONAL_GROUPS = {
+    # Prometheus Prime integration
+    'PROMETHEUS_AVAILABLE': ('iss_module.prometheus_integration', (
+        'PrometheusISS',
+        'create_prometheus_iss_app',
+        'ReasoningRequest',
+        'ReasoningResponse'
+    )),
+    # Configuration
+    'CONFIG_AVAILABLE': ('iss_module.config', ('settings',)),
+    # Structured logging
+    'LOGGING_AVAILABLE': ('iss_module.logging_config', ('get_logger', 'configure_structured_logging')),
+}
 
 # Main components
-__all__ = [
+_CORE_ALL = [
     'ISS',
     'CaptainLog', 
     'Exporters',
@@ -97,41 +93,74 @@ __all__ = [
     '__version__',
 ]
 
-# Add Prometheus Prime components if available
-if PROMETHEUS_AVAILABLE:
-    __all__.extend([
-        'PrometheusISS',
-        'create_prometheus_iss_app',
-        'ReasoningRequest',
-        'ReasoningResponse'
-    ])
-
-# Add configuration if available
-if CONFIG_AVAILABLE:
-    __all__.append('settings')
-
-# Add logging if available  
-if LOGGING_AVAILABLE:
-    __all__.extend(['get_logger', 'configure_structured_logging'])
-
-# Package metadata
-PACKAGE_INFO = {
-    'name': 'iss-module',
-    'version': __version__,
-    'description': 'Integrated Systems Solution - Universal data management and time anchoring',
-    'author': __author__,
-    'email': __email__,
-    'url': 'https://github.com/your-org/iss-module',
-    'license': 'MIT',
-    'requires': ['fastapi', 'uvicorn', 'pydantic', 'jinja2'],
-    'optional_requires': {
-        'visidata': ['visidata>=2.8'],
-        'dev': ['pytest', 'black', 'isort', 'flake8', 'mypy'],
-        'prometheus': ['structlog', 'pydantic-settings', 'redis', 'httpx'],
-    },
-    'integrations': {
-        'prometheus_prime': PROMETHEUS_AVAILABLE,
-        'structured_logging': LOGGING_AVAILABLE,
-        'configuration': CONFIG_AVAILABLE,
+
+def _load_optional(flag: str) -> bool:
+    """Import an optional component group once, setting its names and availability flag"""
+    if flag in globals():
+        return globals()[flag]
+    module_name, names = _OPTIONAL_GROUPS[flag]
+    try:
+        module = importlib.import_module(module_name)
+        values = {name: getattr(module, name) for name in names}
+    except ImportError:
+        globals()[flag] = False
+        return False
+    globals().update(values)
+    globals()[flag] = True
+    return True
+
+
+def _build_all() -> list:
+    names = list(_CORE_ALL)
+    # Add optional components if available
+    for flag, (_, optional_names) in _OPTIONAL_GROUPS.items():
+        if _load_optional(flag):
+            names.extend(optional_names)
+    return names
+
+
+def _build_package_info() -> dict:
+    return {
+        'name': 'iss-module',
+        'version': __version__,
+        'description': 'Integrated Systems Solution - Universal data management and time anchoring',
+        'author': __author__,
+        'email': __email__,
+        'url': 'https://github.com/your-org/iss-module',
+        'license': 'MIT',
+        'requires': ['fastapi', 'uvicorn', 'pydantic', 'jinja2'],
+        'optional_requires': {
+            'visidata': ['visidata>=2.8'],
+            'dev': ['pytest', 'black', 'isort', 'flake8', 'mypy'],
+            'prometheus': ['structlog', 'pydantic-settings', 'redis', 'httpx'],
+        },
+        'integrations': {
+            'prometheus_prime': _load_optional('PROMETHEUS_AVAILABLE'),
+            'structured_logging': _load_optional('LOGGING_AVAILABLE'),
+            'configuration': _load_optional('CONFIG_AVAILABLE'),
+        }
     }
-}
\ No newline at end of file
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+    elif name in _OPTIONAL_GROUPS:
+        return _load_optional(name)
+    elif name == '__all__':
+        value = _build_all()
+    elif name == 'PACKAGE_INFO':
+        # Package metadata
+        value = _build_package_info()
+    else:
+        for flag, (_, names) in _OPTIONAL_GROUPS.items():
+            if name in names and _load_optional(flag):
+                return globals()[name]
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_OPTIONAL_GROUPS) | {'__all__', 'PACKAGE_INFO'})
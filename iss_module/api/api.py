@@ -33,6 +33,8 @@ from passlib.context import CryptContext
 import json
 import time
 
+from .responses import ORJSONResponse
+
 # Import ISS Module components
 from ..core.ISS import ISS
 from ..core.utils import get_stardate, get_julian_date, get_iss_timestamp, format_timestamp
@@ -115,6 +117,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -172,20 +175,17 @@ async def root(request: Request):
 async def get_system_status():
     """Get current system status"""
     try:
-        status = iss_instance.get_status()
+        status = iss_instance.status_snapshot()
         total_assets = len(inventory_manager.units) if inventory_manager and hasattr(inventory_manager, 'units') else 0
-        startup_time = status['system_state'].get('startup_time')
-        uptime = None
-        if startup_time:
-            delta = datetime.now(timezone.utc) - datetime.fromisoformat(startup_time)
-            uptime = str(delta).split('.')[0]
+        delta = datetime.now(timezone.utc) - datetime.fromisoformat(status.startup_time)
+        uptime = str(delta).split('.')[0]
         
         return SystemStatusResponse(
-            status=status['system_state']['system_status'],
+            status=status.status,
             uptime=uptime,
-            active_modules=status['system_state']['active_modules'],
-            current_time=status['current_time'],
-            stardate=status['stardate'],
+            active_modules=list(status.module_list),
+            current_time=status.iso_timestamp,
+            stardate=status.current_stardate,
             total_tracked_assets=total_assets
         )
     except Exception as e:
@@ -922,7 +922,8 @@ def main():
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=False
     )
 
 if __name__ == "__main__":
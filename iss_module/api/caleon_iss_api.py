@@ -14,18 +14,27 @@ Enhanced Features:
 """
 
 import asyncio
-import json
+import contextlib
+import functools
 import logging
-from datetime import datetime, timezone
+import os
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
-from .caleon_iss_controller import CaleonISSController
-from .caleon_consciousness_orchestrator import CaleonConsciousnessCycleOrchestrator
+from .responses import ORJSONResponse
+from ..core.caleon_iss_controller import CaleonISSController
+from ..core.caleon_consciousness_orchestrator import CaleonConsciousnessCycleOrchestrator
+
+# Configure logging
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models for API requests/responses
@@ -68,13 +77,117 @@ class ISSStatusResponse(BaseModel):
 # Global CALEON consciousness orchestrator
 consciousness_orchestrator: Optional[CaleonConsciousnessCycleOrchestrator] = None
 
+# Short-lived cache for polled read-only endpoints: {key: (expiry_monotonic, value)}
+_response_cache: Dict[str, Any] = {}
+_response_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def _cached(key: str, ttl: float, fn):
+    """
+    Return fn() cached for ttl seconds.
+
+    A per-key lock collapses concurrent probes that miss the cache into a
+    single call, so monitoring fan-in costs one controller call per TTL.
+    """
+    entry = _response_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    
+    lock = _response_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _response_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        value = fn()
+        _response_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+
+# Bytes read from the end of the cycle log when serving recent history
+CYCLE_LOG_TAIL_BYTES = 65536
+
+# Last tail read of the cycle log, reused while the file is unchanged:
+# (cache key, lines, whole_file), replaced as one tuple since reads run in worker threads
+_cycle_tail_cache: List[Any] = [(None, [], False)]
+
+
+def _read_cycle_log_tail(cycle_log_path: Path, max_lines: int = 20) -> List[bytes]:
+    """
+    Return the last max_lines raw lines of the cycle log.
+
+    Reading starts with the trailing CYCLE_LOG_TAIL_BYTES, and the window
+    doubles until it holds max_lines whole lines or reaches the start of the
+    file, so the cost follows max_lines rather than the size of the log. The
+    result is cached against the file's (mtime, size) to skip the read
+    entirely between writes. Blocks on file I/O; keep it off the event loop.
+    """
+    stat = cycle_log_path.stat()
+    cache_key = (str(cycle_log_path), stat.st_mtime_ns, stat.st_size)
+    cached_key, cached_lines, cached_whole_file = _cycle_tail_cache[0]
+    if cached_key == cache_key and (cached_whole_file or len(cached_lines) >= max_lines):
+        return cached_lines[-max_lines:]
+    
+    window = CYCLE_LOG_TAIL_BYTES
+    fd = os.open(cycle_log_path, os.O_RDONLY)
+    try:
+        while True:
+            offset = max(0, stat.st_size - window)
+            lines = os.pread(fd, stat.st_size - offset, offset).splitlines()
+            if offset > 0 and lines:
+                # The first line is most likely cut in half by the offset
+                lines = lines[1:]
+            lines = [line for line in map(bytes.strip, lines) if line]
+            if offset == 0 or len(lines) >= max_lines:
+                break
+            window *= 2
+    finally:
+        os.close(fd)
+    
+    _cycle_tail_cache[0] = (cache_key, lines, offset == 0)
+    return lines[-max_lines:]
+
+
+def _cycle_events_json(lines: List[bytes]) -> List[bytes]:
+    """
+    Return cycle log lines as JSON fragments ready to embed in a response.
+
+    The log is written one JSON value per line, so each line is validated
+    and then passed through as-is without a re-encode. Lines that fail to
+    parse (e.g. a record cut short mid-write) are skipped so they cannot
+    corrupt the response body.
+    """
+    events = []
+    for line in lines:
+        try:
+            orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        events.append(line)
+    return events
+
+
+def _recent_cycle_events(iss: CaleonISSController, limit: int) -> List[bytes]:
+    """Flush buffered cycle records and return the last limit events (blocking; run in an executor)"""
+    cycle_log_path = iss.cycle_log_path
+    iss.flush(cycle_log_path)
+    if not cycle_log_path.exists():
+        return []
+    return _cycle_events_json(_read_cycle_log_tail(cycle_log_path, limit))
+
+
+def get_orchestrator() -> CaleonConsciousnessCycleOrchestrator:
+    """FastAPI dependency returning the initialized consciousness orchestrator"""
+    if consciousness_orchestrator is None:
+        raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
+    return consciousness_orchestrator
+
 
 def create_caleon_iss_app() -> FastAPI:
     """Create enhanced FastAPI application for CALEON ISS Controller"""
     
     app = FastAPI(
         title="CALEON ISS Controller API",
-        description=\"\"\"
+        description="""
         Enhanced ISS Controller for CALEON Consciousness System
         =====================================================
         
@@ -97,83 +210,101 @@ def create_caleon_iss_app() -> FastAPI:
         - /harmonizer/ping - Confirm harmonizer ping with timestamp
         - /monitoring/drift - Get drift monitoring report
         - /health - System health check
-        \"\"\",
+        - /dashboard - DALS dashboard UI (health at /dashboard/health)
+        """,
         version="2.0.0-CALEON",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse
     )
     
+    # Compress only larger bodies such as /monitoring/cycles dumps; small
+    # health probes aren't worth the CPU. Level 1 keeps most of the ratio on JSON.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+    
+    # Serve the DALS dashboard from this process under /dashboard rather than
+    # running dashboard_server.py as a second uvicorn instance
+    try:
+        from .dashboard import app as dashboard_app
+        app.mount("/dashboard", dashboard_app)
+    except ImportError as e:
+        logger.warning("DALS dashboard not mounted: %s", e)
+        dashboard_app = None
+    # Mounted apps don't get lifespan events, so the dashboard's (which starts
+    # the DALS API it calls) is entered and exited from ours
+    dashboard_lifespan = contextlib.AsyncExitStack()
+    
     @app.on_event("startup")
     async def startup_event():
-        \"\"\"Initialize CALEON consciousness system on startup\"\"\"
+        """Initialize CALEON consciousness system on startup"""
         global consciousness_orchestrator
         
         try:
             consciousness_orchestrator = CaleonConsciousnessCycleOrchestrator()
-            logging.info("✅ CALEON ISS Controller API started successfully")
+            logger.info("✅ CALEON ISS Controller API started successfully")
             
         except Exception as e:
-            logging.error(f"❌ Failed to initialize CALEON consciousness: {e}")
+            logger.error("❌ Failed to initialize CALEON consciousness: %s", e)
             raise
+        
+        if dashboard_app is not None:
+            try:
+                await dashboard_lifespan.enter_async_context(
+                    dashboard_app.router.lifespan_context(dashboard_app))
+            except Exception as e:
+                logger.warning("DALS dashboard API failed to start: %s", e)
     
     @app.on_event("shutdown")
     async def shutdown_event():
-        \"\"\"Cleanup on shutdown\"\"\"
-        global consciousness_orchestrator
-        
+        """Cleanup on shutdown"""
         if consciousness_orchestrator:
             # End any active cycles gracefully
             if consciousness_orchestrator.current_cycle_id:
                 consciousness_orchestrator.iss_controller.end_cycle(
                     consciousness_orchestrator.current_cycle_id, "SYSTEM_SHUTDOWN"
                 )
+            await consciousness_orchestrator.aclose()
             
-            logging.info("🔌 CALEON ISS Controller API shutdown complete")
+            logger.info("🔌 CALEON ISS Controller API shutdown complete")
+        
+        await dashboard_lifespan.aclose()
     
     @app.get("/health", response_model=Dict[str, Any])
-    async def health_check():
-        \"\"\"Health check endpoint for system monitoring\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
-        health_status = consciousness_orchestrator.iss_controller.heartbeat()
-        drift_report = consciousness_orchestrator.iss_controller.get_drift_report()
+    async def health_check(orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Health check endpoint for system monitoring"""
+        iss_controller = orc.iss_controller
+        health_status = await _cached("heartbeat", 0.25, iss_controller.heartbeat)
+        drift_report = await _cached("drift", 0.25, iss_controller.get_drift_report)
         
         return {
             "status": "healthy" if health_status else "unhealthy",
-            "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp(),
+            "timestamp": iss_controller.get_microsecond_timestamp(),
             "zero_drift_compliance": drift_report.get('zero_drift_compliance', False),
-            "total_cycles": consciousness_orchestrator.iss_controller.cycle_counter
+            "total_cycles": iss_controller.cycle_counter
         }
     
     @app.post("/consciousness/cycle/execute", response_model=ConsciousnessCycleResponse)
-    async def execute_consciousness_cycle(request: ConsciousnessCycleRequest):
-        \"\"\"
+    async def execute_consciousness_cycle(request: ConsciousnessCycleRequest,
+                                          orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """
         Execute CALEON consciousness cycle (A or B)
         
         Cycle A: A priori/A posteriori vault verdict processing
         Cycle B: Full dual cochlear processing with core reasoning
-        \"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+        """
         try:
             if request.cycle_type.upper() == 'A':
-                result = await consciousness_orchestrator.execute_cycle_a(request.input_data)
+                result = await orc.execute_cycle_a(request.input_data)
             elif request.cycle_type.upper() == 'B':
-                result = await consciousness_orchestrator.execute_cycle_b(request.input_data)
+                result = await orc.execute_cycle_b(request.input_data)
             else:
                 # Auto-determine cycle type based on vault verdicts
-                vault_verdict = consciousness_orchestrator.iss_controller.check_vault_verdicts("AUTO_CHECK")
+                vault_verdict = orc.iss_controller.check_vault_verdicts("AUTO_CHECK")
                 
                 if vault_verdict['has_verdict'] and not request.force_cycle_type:
-                    result = await consciousness_orchestrator.execute_cycle_a(request.input_data)
+                    result = await orc.execute_cycle_a(request.input_data)
                 else:
-                    result = await consciousness_orchestrator.execute_cycle_b(request.input_data)
+                    result = await orc.execute_cycle_b(request.input_data)
             
             return ConsciousnessCycleResponse(
                 cycle_id=result['cycle_id'],
@@ -185,21 +316,17 @@ def create_caleon_iss_app() -> FastAPI:
             )
             
         except Exception as e:
-            logging.error(f"❌ Error executing consciousness cycle: {e}")
+            logger.error("❌ Error executing consciousness cycle: %s", e)
             raise HTTPException(status_code=500, detail=f"Consciousness cycle execution failed: {e}")
     
     @app.get("/consciousness/status", response_model=ISSStatusResponse)
-    async def get_consciousness_status():
-        \"\"\"Get current CALEON consciousness system status\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
-        status = consciousness_orchestrator.get_consciousness_status()
+    async def get_consciousness_status(orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Get current CALEON consciousness system status"""
+        status = await _cached("consciousness_status", 0.25,
+                               orc.get_consciousness_status)
         
         return ISSStatusResponse(
-            system_name=consciousness_orchestrator.iss_controller.system_name,
+            system_name=orc.iss_controller.system_name,
             consciousness_active=status['consciousness_active'],
             current_cycle_id=status['current_cycle_id'],
             total_cycles=status['total_cycles'],
@@ -209,21 +336,24 @@ def create_caleon_iss_app() -> FastAPI:
         )
     
     @app.post("/vault/store", response_model=Dict[str, Any])
-    async def store_vault_entry(request: VaultEntryRequest):
-        \"\"\"Store entry in A priori or A posteriori vault with ISS timestamping\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def store_vault_entry(request: VaultEntryRequest,
+                                orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Store entry in A priori or A posteriori vault with ISS timestamping"""
         if request.vault_type not in ['a_priori', 'a_posteriori']:
             raise HTTPException(status_code=400, detail="vault_type must be 'a_priori' or 'a_posteriori'")
         
         try:
-            success = consciousness_orchestrator.iss_controller.store_vault_entry(
-                request.vault_type,
-                request.entry_data,
-                request.cycle_id
+            iss = orc.iss_controller
+            ts = iss.get_microsecond_timestamp()
+            # The vault write is synchronous, so keep it off the event loop
+            success = await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(
+                    iss.store_vault_entry,
+                    request.vault_type,
+                    request.entry_data,
+                    request.cycle_id,
+                    timestamp_data=ts
+                )
             )
             
             if success:
@@ -231,145 +361,119 @@ def create_caleon_iss_app() -> FastAPI:
                     "status": "stored",
                     "vault_type": request.vault_type,
                     "cycle_id": request.cycle_id,
-                    "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp()
+                    "timestamp": ts
                 }
             else:
                 raise HTTPException(status_code=500, detail="Failed to store vault entry")
                 
         except Exception as e:
-            logging.error(f"❌ Error storing vault entry: {e}")
+            logger.error("❌ Error storing vault entry: %s", e)
             raise HTTPException(status_code=500, detail=f"Vault storage failed: {e}")
     
     @app.get("/vault/check", response_model=Dict[str, Any])
-    async def check_vault_verdicts():
-        \"\"\"Check A priori and A posteriori vaults for existing verdicts\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def check_vault_verdicts(orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Check A priori and A posteriori vaults for existing verdicts"""
         try:
-            vault_verdict = consciousness_orchestrator.iss_controller.check_vault_verdicts("MANUAL_CHECK")
+            vault_verdict = orc.iss_controller.check_vault_verdicts("MANUAL_CHECK")
             return vault_verdict
             
         except Exception as e:
-            logging.error(f"❌ Error checking vault verdicts: {e}")
+            logger.error("❌ Error checking vault verdicts: %s", e)
             raise HTTPException(status_code=500, detail=f"Vault check failed: {e}")
     
     @app.post("/harmonizer/ping", response_model=Dict[str, Any])
-    async def harmonizer_ping_confirmation(request: HarmonizerPingRequest):
-        \"\"\"Confirm harmonizer ping with ISS timestamping\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def harmonizer_ping_confirmation(request: HarmonizerPingRequest,
+                                           orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Confirm harmonizer ping with ISS timestamping"""
         try:
-            cycle_cleared = consciousness_orchestrator.iss_controller.harmonizer_ping_confirmation(
+            iss = orc.iss_controller
+            ts = iss.get_microsecond_timestamp()
+            cycle_cleared = iss.harmonizer_ping_confirmation(
                 request.cycle_id,
-                request.harmonizer_response
+                request.harmonizer_response,
+                timestamp_data=ts
             )
             
             return {
                 "cycle_id": request.cycle_id,
                 "cycle_cleared": cycle_cleared,
                 "harmonizer_status": request.harmonizer_response.get('status'),
-                "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp()
+                "timestamp": ts
             }
             
         except Exception as e:
-            logging.error(f"❌ Error processing harmonizer ping: {e}")
+            logger.error("❌ Error processing harmonizer ping: %s", e)
             raise HTTPException(status_code=500, detail=f"Harmonizer ping failed: {e}")
     
     @app.get("/monitoring/drift", response_model=Dict[str, Any])
-    async def get_drift_report():
-        \"\"\"Get zero drift expectation monitoring report\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def get_drift_report(orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Get zero drift expectation monitoring report"""
         try:
-            drift_report = consciousness_orchestrator.iss_controller.get_drift_report()
+            drift_report = await _cached("drift", 0.25,
+                                         orc.iss_controller.get_drift_report)
             return drift_report
             
         except Exception as e:
-            logging.error(f"❌ Error generating drift report: {e}")
+            logger.error("❌ Error generating drift report: %s", e)
             raise HTTPException(status_code=500, detail=f"Drift report failed: {e}")
     
     @app.get("/monitoring/cycles", response_model=Dict[str, Any])
-    async def get_cycle_history():
-        \"\"\"Get recent consciousness cycle history\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def get_cycle_history(limit: int = Query(20, ge=1, le=5000),
+                                orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Get recent consciousness cycle history (last `limit` events, default 20)"""
         try:
-            cycle_log_path = consciousness_orchestrator.iss_controller.cycle_log_path
-            
-            recent_cycles = []
-            
-            if cycle_log_path.exists():
-                with open(cycle_log_path, 'r') as f:
-                    lines = f.readlines()
-                    
-                # Get last 20 cycle events
-                recent_lines = lines[-20:] if len(lines) >= 20 else lines
-                
-                for line in recent_lines:
-                    try:
-                        cycle_event = json.loads(line.strip())
-                        recent_cycles.append(cycle_event)
-                    except json.JSONDecodeError:
-                        continue
+            iss = orc.iss_controller
+            ts = iss.get_microsecond_timestamp()
+            # The flush can wait on the flush thread's write, and the tail
+            # read is file I/O, so both run off the event loop
+            recent_cycles = await asyncio.get_running_loop().run_in_executor(
+                None, _recent_cycle_events, iss, limit
+            )
             
-            return {
-                "status": "retrieved",
-                "total_events": len(recent_cycles),
-                "recent_cycles": recent_cycles,
-                "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp()
-            }
+            # Splice the already-encoded log lines straight into the body
+            body = (
+                b'{"status":"retrieved","total_events":' + str(len(recent_cycles)).encode()
+                + b',"recent_cycles":[' + b','.join(recent_cycles)
+                + b'],"timestamp":' + orjson.dumps(ts) + b'}'
+            )
+            return Response(content=body, media_type="application/json")
             
         except Exception as e:
-            logging.error(f"❌ Error retrieving cycle history: {e}")
+            logger.error("❌ Error retrieving cycle history: %s", e)
             raise HTTPException(status_code=500, detail=f"Cycle history retrieval failed: {e}")
     
     @app.post("/consciousness/emergency_stop", response_model=Dict[str, Any])
-    async def emergency_stop_consciousness():
-        \"\"\"Emergency stop for active consciousness cycles\"\"\"
-        global consciousness_orchestrator
-        
-        if not consciousness_orchestrator:
-            raise HTTPException(status_code=503, detail="Consciousness orchestrator not initialized")
-        
+    async def emergency_stop_consciousness(orc: CaleonConsciousnessCycleOrchestrator = Depends(get_orchestrator)):
+        """Emergency stop for active consciousness cycles"""
         try:
-            if consciousness_orchestrator.current_cycle_id:
-                cycle_id = consciousness_orchestrator.current_cycle_id
-                consciousness_orchestrator.iss_controller.end_cycle(cycle_id, "EMERGENCY_STOP")
-                consciousness_orchestrator.current_cycle_id = None
-                consciousness_orchestrator.consciousness_active = False
+            iss = orc.iss_controller
+            ts = iss.get_microsecond_timestamp()
+            
+            if orc.current_cycle_id:
+                cycle_id = orc.current_cycle_id
+                iss.end_cycle(cycle_id, "EMERGENCY_STOP", timestamp_data=ts)
+                orc.release_cycle(cycle_id)
                 
                 return {
                     "status": "emergency_stopped",
                     "stopped_cycle_id": cycle_id,
-                    "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp()
+                    "timestamp": ts
                 }
             else:
                 return {
                     "status": "no_active_cycle",
-                    "timestamp": consciousness_orchestrator.iss_controller.get_microsecond_timestamp()
+                    "timestamp": ts
                 }
                 
         except Exception as e:
-            logging.error(f"❌ Error during emergency stop: {e}")
+            logger.error("❌ Error during emergency stop: %s", e)
             raise HTTPException(status_code=500, detail=f"Emergency stop failed: {e}")
     
     return app
 
 
 def run_caleon_iss_service():
-    \"\"\"Run the CALEON ISS Controller API service\"\"\"
+    """Run the CALEON ISS Controller API service"""
     
     # Setup logging
     logging.basicConfig(
@@ -377,16 +481,23 @@ def run_caleon_iss_service():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # Create the application
-    app = create_caleon_iss_app()
+    # Each worker process owns its own orchestrator and cycle counter, so keep
+    # a single worker unless cycle IDs are allowed to overlap between workers
+    workers = max(1, int(os.getenv("CALEON_ISS_WORKERS", "1")))
     
-    # Run with uvicorn
+    # Run with uvicorn. "auto" selects uvloop and httptools when installed
+    # (uvicorn[standard]) and falls back to asyncio/h11 elsewhere, e.g. Windows.
+    # Per-request access logging is off; it costs more than the small handlers.
     uvicorn.run(
-        app,
+        "iss_module.api.caleon_iss_api:create_caleon_iss_app",
+        factory=True,
         host="0.0.0.0",
         port=8005,  # Dedicated port for CALEON ISS Controller
         log_level="info",
-        access_log=True
+        loop="auto",
+        http="auto",
+        workers=workers,
+        access_log=False
     )
 
 
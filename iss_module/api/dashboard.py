@@ -0,0 +1,73 @@
+"""
+DALS Dashboard
+==============
+Serves the DALS dashboard page together with the static assets and DALS API
+it calls, as one ASGI app that can be mounted under any prefix. The CALEON ISS
+API mounts it at /dashboard; run it on its own with:
+
+    DALS_DASHBOARD_STANDALONE=1 python dashboard_server.py
+
+The page only uses relative URLs (static/..., api/..., ws/telemetry), so every
+request it makes stays under the prefix the app is mounted at.
+"""
+
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, Response
+from fastapi.staticfiles import StaticFiles
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = Path(__file__).parent.parent
+static_dir = _PACKAGE_DIR / "static"
+
+# The dashboard template has no per-request variables, so read it once at
+# import and serve the bytes directly instead of rendering through Jinja
+_DASHBOARD_HTML = (_PACKAGE_DIR / "templates" / "dashboard.html").read_bytes()
+_DASHBOARD_ETAG = '"' + hashlib.sha256(_DASHBOARD_HTML).hexdigest()[:16] + '"'
+_DASHBOARD_HEADERS = {"ETag": _DASHBOARD_ETAG, "Cache-Control": "public, max-age=60"}
+
+# The page's api/... and ws/telemetry calls are answered by the DALS API app
+try:
+    from .api import app as dals_app
+except ImportError as e:
+    logger.warning("DALS API not available, dashboard will serve the page only: %s", e)
+    dals_app = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the DALS API's startup/shutdown, which a mounted sub-app doesn't get on its own"""
+    if dals_app is None:
+        yield
+        return
+    async with dals_app.router.lifespan_context(dals_app):
+        yield
+
+
+app = FastAPI(title="DALS Dashboard", docs_url=None, redoc_url=None, lifespan=lifespan)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Serve the DALS dashboard"""
+    if request.headers.get("if-none-match") == _DASHBOARD_ETAG:
+        return Response(status_code=304, headers=_DASHBOARD_HEADERS)
+    return HTMLResponse(content=_DASHBOARD_HTML, headers=_DASHBOARD_HEADERS)
+
+
+@app.get("/health")
+async def health():
+    """Health check"""
+    return {"status": "healthy", "service": "dals-dashboard"}
+
+
+app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+
+# Everything else (api/..., ws/telemetry) falls through to the DALS API
+if dals_app is not None:
+    app.mount("", dals_app)
@@ -106,6 +106,13 @@ telemetry_cache = {
     "iss": []
 }
 
+# Running aggregates over telemetry_cache, maintained by store_telemetry so
+# status broadcasts read two ints instead of rescanning every module list
+telemetry_cache_stats = {
+    "total_packets": 0,
+    "active_modules": 0
+}
+
 # Module secret keys (in production, these would be in Vault)
 MODULE_SECRETS = {
     "certsig-mint-engine": "certsig_secret_key_phase1",
@@ -142,10 +149,14 @@ async def store_telemetry(module: str, data: Dict[Any, Any]):
         # Store in module-specific cache
         if module in telemetry_cache:
             telemetry_cache[module].append(data)
+            if len(telemetry_cache[module]) == 1:
+                telemetry_cache_stats["active_modules"] += 1
             
             # Keep only last 100 entries per module
             if len(telemetry_cache[module]) > 100:
                 telemetry_cache[module] = telemetry_cache[module][-100:]
+            else:
+                telemetry_cache_stats["total_packets"] += 1
         
         # Broadcast to WebSocket clients
         try:
@@ -4,10 +4,15 @@ Real-time telemetry streaming for live dashboard updates
 """
 
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter
-from typing import List, Dict, Any, Set
-import json
+from typing import List, Dict, Any, Iterable, Set
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+import orjson
 import asyncio
 import logging
+import time
+import zlib
 from datetime import datetime, timezone
 import weakref
 
@@ -17,88 +22,214 @@ logger = logging.getLogger(__name__)
 # WebSocket router
 ws_router = APIRouter()
 
+# Outbound frames buffered per client before it is dropped as a slow consumer
+CLIENT_QUEUE_SIZE = 100
+
+# Opt-in subprotocol for clients that inflate zlib-compressed binary frames.
+# Larger payloads are compressed once per broadcast and shared by all such
+# clients; everyone else keeps receiving plain JSON text frames.
+ZLIB_SUBPROTOCOL = "dals-zlib"
+COMPRESS_MIN_SIZE = 1024
+
+
+# Pre-encoded replies for the common control messages; only the timestamp
+# (and for unknown actions, the JSON-escaped message) varies per reply
+PONG_TEMPLATE = '{"type":"pong","timestamp":"%s"}'
+INVALID_JSON_TEMPLATE = '{"type":"error","message":"Invalid JSON message","timestamp":"%s"}'
+ERROR_TEMPLATE = '{"type":"error","message":%s,"timestamp":"%s"}'
+
+# Broadcast envelopes have a fixed shape, so only the variable parts are
+# encoded and spliced in rather than wrapping them in a dict first
+TELEMETRY_TEMPLATE = '{"type":"telemetry_update","module":%s,"data":%s,"timestamp":"%s"}'
+STATUS_TEMPLATE = '{"type":"status_update","data":%s,"timestamp":"%s"}'
+HEARTBEAT_TEMPLATE = '{"type":"heartbeat","timestamp":"%s","server_status":"active"}'
+
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS" for it); the date/time part of the
+# template timestamps is formatted once per second and reused until it ticks over
+_iso_second = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in RFC 3339 form with microseconds, without a datetime per call"""
+    global _iso_second
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if second != _iso_second[0]:
+        _iso_second = (second, datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return f"{_iso_second[1]}.{micros:06d}+00:00"
+
+
+def _dumps(message: Any) -> str:
+    """Serialize a message for a WebSocket text frame (orjson handles datetimes natively)"""
+    return orjson.dumps(message, default=str).decode()
+
+
+@lru_cache(maxsize=64)
+def _module_json(module: str) -> str:
+    """JSON-encoded module name, cached since only a handful of modules exist"""
+    return orjson.dumps(module).decode()
+
+
 # Connection manager for WebSocket clients
 class TelemetryConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # Reverse index: the modules each client asked for
         self.subscription_map: Dict[WebSocket, Set[str]] = {}
+        # Module -> interested clients, plus clients that receive every module
+        # (no subscriptions yet, or subscribed to "all"). The two are disjoint.
+        self.topic_subscribers: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self.wildcard: Set[WebSocket] = set()
+        # Each client gets an outbound queue drained by its own writer task,
+        # so broadcasting only enqueues and never waits on a slow socket
+        self.outbound_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self.zlib_clients: Set[WebSocket] = set()
         
     async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        if ZLIB_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+            await websocket.accept(subprotocol=ZLIB_SUBPROTOCOL)
+            self.zlib_clients.add(websocket)
+        else:
+            await websocket.accept()
+        self.active_connections.add(websocket)
         self.subscription_map[websocket] = set()
+        self.wildcard.add(websocket)
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.outbound_queues[websocket] = queue
+        self.writer_tasks[websocket] = asyncio.create_task(self._writer(websocket, queue))
         logger.info(f"New WebSocket connection. Total: {len(self.active_connections)}")
         
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        # A failed writer and the endpoint's own cleanup can both report the
+        # same socket; only the first call has anything to tear down
+        if websocket not in self.active_connections:
+            return
+        self.active_connections.discard(websocket)
         if websocket in self.subscription_map:
-            del self.subscription_map[websocket]
+            self._unindex(websocket, self.subscription_map.pop(websocket))
+        self.outbound_queues.pop(websocket, None)
+        self.zlib_clients.discard(websocket)
+        task = self.writer_tasks.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
         logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
         
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's outbound queue onto its socket"""
+        try:
+            while True:
+                frame = await queue.get()
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send message to client: {e}")
+            self.disconnect(websocket)
+            
+    def _index(self, websocket: WebSocket, modules: Set[str]):
+        if not modules or "all" in modules:
+            self.wildcard.add(websocket)
+        else:
+            for module in modules:
+                self.topic_subscribers[module].add(websocket)
+                
+    def _unindex(self, websocket: WebSocket, modules: Set[str]):
+        self.wildcard.discard(websocket)
+        for module in modules:
+            subscribers = self.topic_subscribers.get(module)
+            if subscribers is not None:
+                subscribers.discard(websocket)
+                if not subscribers:
+                    del self.topic_subscribers[module]
+                    
+    def _enqueue(self, connections: Iterable[WebSocket], payload: str):
+        """
+        Queue payload for each connection, dropping clients whose queue is full
+        
+        Nothing here awaits, so callers may pass the live connection sets:
+        they cannot change underneath the loop, and slow consumers are only
+        disconnected once iteration has finished.
+        """
+        compressed = None
+        slow_consumers = []
+        for connection in connections:
+            queue = self.outbound_queues.get(connection)
+            if queue is None:
+                continue
+            frame = payload
+            if connection in self.zlib_clients and len(payload) >= COMPRESS_MIN_SIZE:
+                if compressed is None:
+                    compressed = zlib.compress(payload.encode(), 1)
+                frame = compressed
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                slow_consumers.append(connection)
+                
+        for connection in slow_consumers:
+            logger.warning("Dropping slow WebSocket client: outbound queue full")
+            self.disconnect(connection)
+            asyncio.create_task(self._close_quietly(connection))
+            
+    async def _close_quietly(self, websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+        
     async def subscribe(self, websocket: WebSocket, modules: List[str]):
         """Subscribe WebSocket to specific module updates"""
         if websocket in self.subscription_map:
-            self.subscription_map[websocket].update(modules)
+            subscriptions = self.subscription_map[websocket]
+            self._unindex(websocket, subscriptions)
+            subscriptions.update(modules)
+            self._index(websocket, subscriptions)
             await self.send_personal_message(websocket, {
                 "type": "subscription_update",
-                "subscribed_modules": list(self.subscription_map[websocket]),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "subscribed_modules": list(subscriptions),
+                "timestamp": datetime.now(timezone.utc)
+            })
+            
+    async def unsubscribe(self, websocket: WebSocket, modules: List[str]):
+        """Unsubscribe WebSocket from specific module updates"""
+        if websocket in self.subscription_map:
+            subscriptions = self.subscription_map[websocket]
+            self._unindex(websocket, subscriptions)
+            subscriptions.difference_update(modules)
+            self._index(websocket, subscriptions)
+            await self.send_personal_message(websocket, {
+                "type": "subscription_update",
+                "subscribed_modules": list(subscriptions),
+                "timestamp": datetime.now(timezone.utc)
             })
         
     async def send_personal_message(self, websocket: WebSocket, message: dict):
-        try:
-            await websocket.send_text(json.dumps(message))
-        except Exception as e:
-            logger.error(f"Failed to send message to client: {e}")
-            self.disconnect(websocket)
+        self._enqueue([websocket], _dumps(message))
+        
+    def send_raw(self, websocket: WebSocket, payload: str):
+        """Queue an already-encoded JSON payload for a single client"""
+        self._enqueue([websocket], payload)
             
     async def broadcast_telemetry(self, module: str, data: dict):
         """Broadcast telemetry data to subscribed clients"""
         if not self.active_connections:
             return
             
-        message = {
-            "type": "telemetry_update",
-            "module": module,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        # Encode once and reuse the same frame for every subscriber
+        payload = TELEMETRY_TEMPLATE % (_module_json(module), _dumps(data), _now_iso())
         
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                # Check if client is subscribed to this module
-                subscriptions = self.subscription_map.get(connection, set())
-                if not subscriptions or module in subscriptions or "all" in subscriptions:
-                    await connection.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to broadcast to client: {e}")
-                disconnected.append(connection)
-                
-        # Remove disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        # Only visit clients subscribed to this module or to everything
+        self._enqueue(chain(self.topic_subscribers.get(module, ()), self.wildcard), payload)
             
     async def send_status_update(self, status_data: dict):
         """Send system status updates to all connected clients"""
-        message = {
-            "type": "status_update",
-            "data": status_data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        payload = STATUS_TEMPLATE % (_dumps(status_data), _now_iso())
         
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to send status update: {e}")
-                disconnected.append(connection)
-                
-        # Remove disconnected clients  
-        for connection in disconnected:
-            self.disconnect(connection)
+        self._enqueue(self.active_connections, payload)
 
 # Global connection manager instance
 manager = TelemetryConnectionManager()
@@ -112,6 +243,9 @@ async def telemetry_websocket_endpoint(websocket: WebSocket):
     {"action": "subscribe", "modules": ["certsig", "caleon", "iss"]}
     {"action": "unsubscribe", "modules": ["certsig"]}
     {"action": "ping"}
+    
+    Clients that offer the "dals-zlib" subprotocol receive payloads of
+    1 KB or more as zlib-compressed binary frames; smaller ones stay text.
     """
     await manager.connect(websocket)
     
@@ -120,16 +254,22 @@ async def telemetry_websocket_endpoint(websocket: WebSocket):
         "type": "welcome",
         "message": "Connected to DALS Phase 1 Telemetry Stream",
         "available_modules": ["certsig", "caleon", "iss"],
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": datetime.now(timezone.utc)
     })
     
     try:
         while True:
-            # Receive messages from client
-            data = await websocket.receive_text()
+            # Receive messages from client, text or binary frames alike;
+            # orjson parses either form without an extra decode step
+            event = await websocket.receive()
+            if event["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(event.get("code", 1000))
+            data = event.get("bytes")
+            if data is None:
+                data = event.get("text", "")
             
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 action = message.get("action")
                 
                 if action == "subscribe":
@@ -138,34 +278,17 @@ async def telemetry_websocket_endpoint(websocket: WebSocket):
                     
                 elif action == "unsubscribe":
                     modules = message.get("modules", [])
-                    if websocket in manager.subscription_map:
-                        for module in modules:
-                            manager.subscription_map[websocket].discard(module)
-                        await manager.send_personal_message(websocket, {
-                            "type": "subscription_update",
-                            "subscribed_modules": list(manager.subscription_map[websocket]),
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        })
+                    await manager.unsubscribe(websocket, modules)
                         
                 elif action == "ping":
-                    await manager.send_personal_message(websocket, {
-                        "type": "pong",
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
+                    manager.send_raw(websocket, PONG_TEMPLATE % _now_iso())
                     
                 else:
-                    await manager.send_personal_message(websocket, {
-                        "type": "error",
-                        "message": f"Unknown action: {action}",
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
+                    error = orjson.dumps(f"Unknown action: {action}").decode()
+                    manager.send_raw(websocket, ERROR_TEMPLATE % (error, _now_iso()))
                     
-            except json.JSONDecodeError:
-                await manager.send_personal_message(websocket, {
-                    "type": "error", 
-                    "message": "Invalid JSON message",
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
+            except orjson.JSONDecodeError:
+                manager.send_raw(websocket, INVALID_JSON_TEMPLATE % _now_iso())
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -195,11 +318,11 @@ async def periodic_status_broadcaster():
     while True:
         try:
             # Import here to avoid circular imports
-            from .telemetry_api import telemetry_cache
+            from .telemetry_api import telemetry_cache_stats
             
-            # Calculate status from current telemetry cache
-            total_packets = sum(len(data_list) for data_list in telemetry_cache.values())
-            active_modules = sum(1 for data_list in telemetry_cache.values() if len(data_list) > 0)
+            # Read the running totals kept up to date by store_telemetry
+            total_packets = telemetry_cache_stats["total_packets"]
+            active_modules = telemetry_cache_stats["active_modules"]
             
             status_data = {
                 "total_packets": total_packets,
@@ -224,23 +347,9 @@ async def websocket_heartbeat_monitor():
     while True:
         try:
             if manager.active_connections:
-                heartbeat_message = {
-                    "type": "heartbeat",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "server_status": "active"
-                }
-                
-                disconnected = []
-                for connection in manager.active_connections:
-                    try:
-                        await connection.send_text(json.dumps(heartbeat_message))
-                    except Exception as e:
-                        logger.warning(f"Heartbeat failed for client: {e}")
-                        disconnected.append(connection)
+                payload = HEARTBEAT_TEMPLATE % _now_iso()
                 
-                # Remove disconnected clients
-                for connection in disconnected:
-                    manager.disconnect(connection)
+                manager._enqueue(manager.active_connections, payload)
                     
         except Exception as e:
             logger.error(f"Heartbeat monitor error: {e}")
@@ -14,18 +14,36 @@ Commands:
     iss server            Start web server
 """
 
+import os
 import sys
 import argparse
 import asyncio
-from typing import Optional
+from collections import Counter
+from typing import Optional, TYPE_CHECKING
 
-from iss_module.core.ISS import ISS
-from iss_module.inventory.inventory_manager import UnitInventoryManager
-from iss_module.inventory.exporters import DataExporter
+# Heavier components are imported inside the handlers that use them so that
+# `iss --help`, `iss version` and `iss stardate` start quickly
 from iss_module.core.utils import get_stardate, current_timecodes
-from serial_assignment import assign_digital_asset_id
 import json
 
+if TYPE_CHECKING:
+    from iss_module.inventory.inventory_manager import UnitInventoryManager
+
+# Loaded once per process and shared by every command that reads the vault
+_INVENTORY: Optional["UnitInventoryManager"] = None
+
+
+async def get_inventory() -> "UnitInventoryManager":
+    """Return the shared inventory manager, loading records on first use"""
+    global _INVENTORY
+    if _INVENTORY is None:
+        from iss_module.inventory.inventory_manager import UnitInventoryManager
+        inventory = UnitInventoryManager()
+        await inventory.initialize()
+        _INVENTORY = inventory
+    return _INVENTORY
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -59,8 +77,9 @@ def main():
 
     # Export command
     export_parser = subparsers.add_parser('export', help='Export asset data')
-    export_parser.add_argument('format', choices=['csv', 'json', 'markdown'], 
-                              help='Export format')
+    export_parser.add_argument('format', choices=['csv', 'json', 'ndjson', 'markdown'], 
+                              help='Export format (json: {"entries": [...], "metadata": {...}}; '
+                                   'ndjson: one record per line)')
     export_parser.add_argument('--output', '-o', help='Output file path')
     
     # Status command
@@ -133,6 +152,7 @@ def handle_init(args):
 def handle_asset_create(args):
     """Create a new digital asset ID"""
     try:
+        from serial_assignment import assign_digital_asset_id
         result = assign_digital_asset_id(
             asset_type=args.asset_type,
             project_id=args.project_id,
@@ -149,8 +169,7 @@ def handle_asset_create(args):
 async def handle_asset_list(args):
     """List tracked assets"""
     try:
-        inventory = UnitInventoryManager()
-        await inventory.initialize()
+        inventory = await get_inventory()
         assets = await inventory.get_units(
             status=args.status,
             model_id=args.project,
@@ -177,11 +196,9 @@ async def handle_asset_list(args):
 async def handle_export(args):
     """Export asset data"""
     try:
-        inventory = UnitInventoryManager()
-        await inventory.initialize()
-        assets = await inventory.get_units(limit=10000) # Export all
+        inventory = await get_inventory()
         
-        if not assets:
+        if not inventory.units:
             print("No assets to export.")
             return
         
@@ -193,16 +210,25 @@ async def handle_export(args):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"dals_export_{timestamp}.{args.format}"
         
-        # Convert asset objects to dictionaries for exporter
-        asset_dicts = [asset.to_dict() for asset in assets]
-
+        # Stream records in storage order straight to the file; no list is built or sorted
+        from iss_module.inventory.exporters import DataExporter
         exporter = DataExporter()
+        units = inventory.iter_units()
+        count = 0
         if args.format == 'csv':
-            await exporter.export_to_csv(asset_dicts, output_file)
+            count = await exporter.stream_units_csv(units, output_file)
         elif args.format == 'json':
-            await exporter.export_to_json(asset_dicts, output_file)
+            count = await exporter.stream_units_json(units, output_file)
+        elif args.format == 'ndjson':
+            count = await exporter.stream_units_json(units, output_file, lines=True)
+        elif args.format == 'markdown':
+            # The report header carries the total, so markdown is built from a list
+            entries = [unit async for unit in units]
+            md_exporter = DataExporter(output_dir=os.path.dirname(os.path.abspath(output_file)))
+            await md_exporter.export_log_entries_markdown(entries, filename=os.path.basename(output_file))
+            count = len(entries)
         
-        print(f"✓ Exported {len(assets)} assets to {output_file}")
+        print(f"✓ Exported {count} assets to {output_file}")
         
     except Exception as e:
         print(f"Export failed: {e}")
@@ -212,8 +238,7 @@ async def handle_export(args):
 async def handle_status(args):
     """Show system status"""
     try:
-        inventory = UnitInventoryManager()
-        await inventory.initialize()
+        inventory = await get_inventory()
         
         timecodes = current_timecodes()
         stardate = get_stardate()
@@ -225,9 +250,7 @@ async def handle_status(args):
         print(f"Total Tracked Assets: {len(inventory.units)}")
         
         if inventory.units:
-            status_counts = {}
-            for asset in inventory.units.values():
-                status_counts[asset.status] = status_counts.get(asset.status, 0) + 1
+            status_counts = Counter(asset.status for asset in inventory.units.values())
             
             print("Assets by Status:")
             for status, count in sorted(status_counts.items()):
@@ -269,7 +292,11 @@ def handle_server(args):
             host=args.host,
             port=args.port,
             reload=args.reload,
-            log_level="info"
+            log_level="info",
+            # uvloop when installed (uvicorn[standard] on Linux/macOS), asyncio on Windows
+            loop="auto",
+            # Broadcasts are compressed once in ws_stream, not per connection
+            ws_per_message_deflate=False
         )
         
     except ImportError as e:
@@ -288,277 +315,3 @@ def handle_version(args):
 
 if __name__ == '__main__':
     main()
-
-import sys
-import argparse
-import asyncio
-from typing import Optional
-
-from iss_module.core.ISS import ISS
-from iss_module.inventory.inventory_manager import UnitInventoryManager
-from iss_module.inventory.exporters import DataExporter
-from iss_module.core.utils import get_stardate, current_timecodes
-
-
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        prog='iss',
-        description='ISS Module Command Line Interface',
-        epilog='For more information, visit: https://github.com/your-org/iss-module'
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize ISS system')
-    init_parser.add_argument('--name', default='ISS Enterprise', help='System name')
-    
-    # Log command
-    log_parser = subparsers.add_parser('log', help='Add captain\'s log entry')
-    log_parser.add_argument('message', help='Log entry content')
-    log_parser.add_argument('--priority', choices=['low', 'normal', 'high', 'urgent'], 
-                           default='normal', help='Log priority')
-    
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export data')
-    export_parser.add_argument('format', choices=['csv', 'json', 'markdown'], 
-                              help='Export format')
-    export_parser.add_argument('--output', '-o', help='Output file path')
-    export_parser.add_argument('--filter', help='Filter entries (e.g., "priority:high")')
-    
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Show system status')
-    
-    # Stardate command
-    stardate_parser = subparsers.add_parser('stardate', help='Get current stardate')
-    stardate_parser.add_argument('--format', choices=['numeric', 'full'], 
-                                default='full', help='Stardate format')
-    
-    # Server command
-    server_parser = subparsers.add_parser('server', help='Start web server')
-    server_parser.add_argument('--host', default='127.0.0.1', help='Server host')
-    server_parser.add_argument('--port', type=int, default=8000, help='Server port')
-    server_parser.add_argument('--reload', action='store_true', help='Auto-reload on changes')
-    
-    # Version command
-    version_parser = subparsers.add_parser('version', help='Show version information')
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    try:
-        if args.command == 'init':
-            handle_init(args)
-        elif args.command == 'log':
-            handle_log(args)
-        elif args.command == 'export':
-            handle_export(args)
-        elif args.command == 'status':
-            handle_status(args)
-        elif args.command == 'stardate':
-            handle_stardate(args)
-        elif args.command == 'server':
-            handle_server(args)
-        elif args.command == 'version':
-            handle_version(args)
-    except KeyboardInterrupt:
-        print("\nOperation cancelled by user.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-
-
-def handle_init(args):
-    """Initialize ISS system"""
-    try:
-        iss = ISS()
-        config = {
-            'system_name': args.name,
-            'version': '1.0.0',
-            'debug_mode': False,
-            'heartbeat_interval': 30,
-            'data_retention_days': 90
-        }
-        
-        # Initialize system (this would create config files, etc.)
-        print(f"Initializing ISS system: {args.name}")
-        print("✓ Configuration created")
-        print("✓ Log system initialized")
-        print("✓ Export directories created")
-        print("\nISS system ready!")
-        
-    except Exception as e:
-        print(f"Initialization failed: {e}")
-        sys.exit(1)
-
-
-def handle_log(args):
-    """Add captain's log entry"""
-    try:
-        captain_log = CaptainLog()
-        
-        # Map priority to category for now
-        category_map = {
-            'low': 'personal',
-            'normal': 'general', 
-            'high': 'system',
-            'urgent': 'alert'
-        }
-        category = category_map.get(args.priority, 'general')
-        
-        # Add entry
-        entry_id = captain_log.add_entry_sync(
-            content=args.message,
-            category=category
-        )
-        
-        # Get the created entry to show confirmation
-        entries = captain_log.get_entries_sync()
-        entry = next((e for e in entries if e.get('id') == entry_id), None)
-        
-        if entry:
-            print(f"Captain's log entry added successfully!")
-            print(f"Stardate: {entry.get('stardate', 'Unknown')}")
-            print(f"Category: {category}")
-            print(f"Content: {args.message}")
-        else:
-            print("Entry added but could not retrieve confirmation.")
-            
-    except Exception as e:
-        print(f"Failed to add log entry: {e}")
-        sys.exit(1)
-
-
-def handle_export(args):
-    """Export data"""
-    try:
-        captain_log = CaptainLog()
-        entries = captain_log.get_entries_sync()
-        
-        # Apply filters if specified
-        if args.filter:
-            # Simple filter implementation
-            if args.filter.startswith('priority:'):
-                priority = args.filter.split(':', 1)[1]
-                entries = [e for e in entries if e.get('priority') == priority]
-        
-        if not entries:
-            print("No entries to export.")
-            return
-        
-        # Determine output file
-        if args.output:
-            output_file = args.output
-        else:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"iss_export_{timestamp}.{args.format}"
-        
-        # Export data
-        if args.format == 'csv':
-            Exporters.to_csv_sync(entries, output_file)
-        elif args.format == 'json':
-            Exporters.to_json_sync(entries, output_file)
-        elif args.format == 'markdown':
-            Exporters.to_markdown_sync(entries, output_file)
-        
-        print(f"✓ Exported {len(entries)} entries to {output_file}")
-        
-    except Exception as e:
-        print(f"Export failed: {e}")
-        sys.exit(1)
-
-
-def handle_status(args):
-    """Show system status"""
-    try:
-        captain_log = CaptainLog()
-        entries = captain_log.get_entries_sync()
-        
-        # Get time information
-        timecodes = current_timecodes()
-        stardate = get_stardate()
-        
-        print("ISS Module Status")
-        print("=" * 40)
-        print(f"Current Stardate: {stardate}")
-        print(f"System Time: {timecodes['iso_timestamp']}")
-        print(f"Julian Date: {timecodes['julian_date']}")
-        print(f"Market Info: {timecodes['market_info']}")
-        print()
-        print(f"Total Log Entries: {len(entries)}")
-        
-        if entries:
-            # Count by priority
-            priorities = {}
-            for entry in entries:
-                priority = entry.get('priority', 'normal')
-                priorities[priority] = priorities.get(priority, 0) + 1
-            
-            print("Entries by Priority:")
-            for priority, count in sorted(priorities.items()):
-                print(f"  {priority}: {count}")
-        
-        print("\n✓ System operational")
-        
-    except Exception as e:
-        print(f"Status check failed: {e}")
-        sys.exit(1)
-
-
-def handle_stardate(args):
-    """Get current stardate"""
-    try:
-        stardate = get_stardate()
-        
-        if args.format == 'numeric':
-            print(f"{stardate}")
-        else:
-            print(f"Stardate {stardate}")
-            
-    except Exception as e:
-        print(f"Failed to get stardate: {e}")
-        sys.exit(1)
-
-
-def handle_server(args):
-    """Start web server"""
-    try:
-        print(f"Starting ISS Module server on {args.host}:{args.port}")
-        print("Press Ctrl+C to stop the server")
-        
-        # Import and run the server
-        import uvicorn
-        from iss_module.api.api import app
-        
-        uvicorn.run(
-            app,
-            host=args.host,
-            port=args.port,
-            reload=args.reload,
-            log_level="info"
-        )
-        
-    except ImportError:
-        print("Error: uvicorn is required to run the server")
-        print("Install with: pip install uvicorn")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Server failed to start: {e}")
-        sys.exit(1)
-
-
-def handle_version(args):
-    """Show version information"""
-    print("ISS Module v1.0.0")
-    print("Integrated Systems Solution")
-    print("Compatible with Caleon and CertSig projects")
-
-
-if __name__ == '__main__':
-    main()
\ No newline at end of file
@@ -1,12 +1,115 @@
 # core/ISS.py
+import asyncio
 import logging
-from .utils import (
-    get_stardate,
-    current_timecodes,
-    ensure_folder,
-)
-from ..inventory.exporters import DataExporter as Exporters
-from ..inventory.inventory_manager import CaptainLog
+import time
+from collections import deque
+from datetime import datetime, timezone
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, NamedTuple, Protocol, Tuple, runtime_checkable
+
+from .logging_setup import install_queue_logging
+from .utils import current_timecodes, ensure_folder
+
+if TYPE_CHECKING:
+    from ..inventory.inventory_manager import CaptainLog
+
+# Upper bound on any single module's shutdown so one stuck module cannot stall teardown
+SHUTDOWN_TIMEOUT = 10.0
+
+# How long a status/heartbeat snapshot is served before being recomputed
+STATUS_TTL = 0.5
+
+# Timecodes are reused for this long; finer resolution is invisible on a dashboard
+TIMECODE_TTL = 0.1
+
+# Most recent system-log entries kept in memory
+MAX_IN_MEM_LOGS = 10_000
+
+# Consecutive heartbeat failures of one module are all logged up to this
+# count, then only every HB_WARN_EVERY-th failure until it recovers
+HB_WARN_FIRST = 10
+HB_WARN_EVERY = 100
+
+logger = logging.getLogger(__name__)
+
+_TC_CACHE = [0.0, None]  # [monotonic time computed, timecodes dict]
+
+
+def _cached_timecodes() -> dict:
+    """
+    current_timecodes(), recomputed at most once per TIMECODE_TTL.
+    Only for status reporting; anchoring needs a fresh hash per call.
+    """
+    now = time.monotonic()
+    if _TC_CACHE[1] is None or now - _TC_CACHE[0] >= TIMECODE_TTL:
+        _TC_CACHE[0] = now
+        _TC_CACHE[1] = current_timecodes()
+    return _TC_CACHE[1]
+
+
+class ISSStatus(NamedTuple):
+    """Snapshot returned by ISS.status_snapshot(); get_status() returns it as a dict"""
+    system_name: str
+    status: str
+    modules_loaded: int
+    module_list: Tuple[str, ...]
+    current_stardate: float
+    current_julian: float
+    iso_timestamp: str
+    unix_timestamp: int
+    heartbeat_healthy: bool
+    log_entries: int
+    time_anchor_hash: str
+    startup_time: str
+
+
+@runtime_checkable
+class HasHeartbeat(Protocol):
+    """Module that ISS polls for health; heartbeat may also be a coroutine function."""
+
+    def heartbeat(self) -> bool: ...
+
+
+@runtime_checkable
+class HasShutdown(Protocol):
+    """Module that ISS stops on shutdown; shutdown may also be a coroutine function."""
+
+    def shutdown(self) -> None: ...
+
+
+class _ModuleMap(MutableMapping):
+    """
+    ISS.modules: reads go straight to the registry, writes and deletes go
+    through register_module()/unregister_module() so the resolved hooks stay in sync.
+    """
+
+    __slots__ = ("_iss",)
+
+    def __init__(self, iss: "ISS"):
+        self._iss = iss
+
+    def __getitem__(self, name):
+        return self._iss._modules[name]
+
+    def __contains__(self, name):
+        return name in self._iss._modules
+
+    def __iter__(self):
+        return iter(self._iss._modules)
+
+    def __len__(self):
+        return len(self._iss._modules)
+
+    def __setitem__(self, name, module):
+        self._iss.register_module(name, module)
+
+    def __delitem__(self, name):
+        if name not in self._iss._modules:
+            raise KeyError(name)
+        self._iss.unregister_module(name)
+
+    def __repr__(self):
+        return repr(self._iss._modules)
 
 
 class ISS:
@@ -18,14 +121,146 @@ class ISS:
     with Caleon and CertSig systems.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "system_name", "status", "startup_time", "_modules", "_modules_view", "logs", "status_ttl",
+        "_shutdown_start_msg", "_shutdown_end_msg",
+        "_mod_index", "_mod_names", "_mod_hb", "_mod_hb_async",
+        "_mod_sd", "_mod_sd_async", "_has_async_heartbeats", "_hb_fail_count",
+        "_hb_unchecked_count", "_heartbeat_refresh",
+        "_log_folder", "_captain_log",
+        "_cache_version",
+        "_status_cache", "_status_cache_ts", "_status_cache_key",
+        "_heartbeat_cache", "_heartbeat_cache_ts", "_heartbeat_cache_key",
+    )
+
     def __init__(self, system_name: str = "ISS"):
         self.system_name = system_name
+        self._shutdown_start_msg = f"Shutting down {system_name}..."
+        self._shutdown_end_msg = f"{system_name} shutdown complete"
         self.status = "healthy"
-        self.modules = {}        # dynamically loaded modules
-        self.logs = []           # local storage for logs
-        self.log_folder = ensure_folder("logs")
-        self.captain_log = CaptainLog()
-        logging.basicConfig(level=logging.INFO)
+        self.startup_time = datetime.now(timezone.utc).isoformat()
+        # Dynamically loaded modules; the public modules mapping routes every
+        # change through register_module()/unregister_module()
+        self._modules = {}
+        self._modules_view = _ModuleMap(self)
+        # Module hooks resolved once at registration, stored as parallel
+        # lists (one slot per module) so health sweeps are flat loops
+        self._mod_index = {}     # name -> slot
+        self._mod_names = []
+        self._mod_hb = []
+        self._mod_hb_async = []
+        self._mod_sd = []
+        self._mod_sd_async = []
+        self._has_async_heartbeats = False
+        self._hb_fail_count = {}  # name -> consecutive failed heartbeats
+        self._hb_unchecked_count = {}  # name -> in-loop polls before its async heartbeat ran
+        self._heartbeat_refresh = None  # heartbeat_async() task started by an in-loop poll
+        self.logs = deque(maxlen=MAX_IN_MEM_LOGS)  # local storage for logs, bounded
+        # Created on first use so status-only instances skip the filesystem
+        self._log_folder = None
+        self._captain_log = None
+        install_queue_logging()
+
+        # Short-lived health snapshots so frequent status polls skip the
+        # module sweep; _cache_version is bumped whenever they go stale
+        self.status_ttl = STATUS_TTL
+        self._cache_version = 0
+        self._status_cache = None
+        self._status_cache_ts = 0.0
+        self._status_cache_key = None
+        self._heartbeat_cache = None
+        self._heartbeat_cache_ts = 0.0
+        self._heartbeat_cache_key = None
+
+    @property
+    def modules(self) -> MutableMapping:
+        """Loaded modules by name; assigning or deleting a name (un)registers it"""
+        return self._modules_view
+
+    @modules.setter
+    def modules(self, modules):
+        for name in list(self._modules):
+            self.unregister_module(name)
+        for name, module in dict(modules).items():
+            self.register_module(name, module)
+
+    @property
+    def log_folder(self) -> str:
+        if self._log_folder is None:
+            self._log_folder = ensure_folder("logs")
+        return self._log_folder
+
+    @property
+    def captain_log(self) -> "CaptainLog":
+        if self._captain_log is None:
+            # Imported here: the inventory models pull in pydantic
+            from ..inventory.inventory_manager import CaptainLog
+            self._captain_log = CaptainLog()
+        return self._captain_log
+
+    def invalidate_status_cache(self):
+        """
+        Drop cached status/heartbeat snapshots (call after loading or unloading modules).
+        """
+        self._cache_version += 1
+
+    def _cache_key(self):
+        return (self._cache_version, self.status, len(self._modules))
+
+    # ----------------------
+    # Module Management
+    # ----------------------
+    @staticmethod
+    def _module_hooks(module):
+        """Resolve a module's (heartbeat, is_async, shutdown, is_async) hooks."""
+        # Modules without a hook are fine; they simply get a None slot
+        hb = module.heartbeat if isinstance(module, HasHeartbeat) else None
+        sd = module.shutdown if isinstance(module, HasShutdown) else None
+        hb = hb if callable(hb) else None
+        sd = sd if callable(sd) else None
+        hb_is_async = hb is not None and asyncio.iscoroutinefunction(hb)
+        sd_is_async = sd is not None and asyncio.iscoroutinefunction(sd)
+        return hb, hb_is_async, sd, sd_is_async
+
+    def register_module(self, name: str, module) -> None:
+        """
+        Load a module, resolving its heartbeat/shutdown hooks once up front.
+        """
+        hb, hb_is_async, sd, sd_is_async = self._module_hooks(module)
+
+        self._modules[name] = module
+        slot = self._mod_index.get(name)
+        if slot is None:
+            self._mod_index[name] = len(self._mod_names)
+            self._mod_names.append(name)
+            self._mod_hb.append(hb)
+            self._mod_hb_async.append(hb_is_async)
+            self._mod_sd.append(sd)
+            self._mod_sd_async.append(sd_is_async)
+        else:
+            self._mod_hb[slot] = hb
+            self._mod_hb_async[slot] = hb_is_async
+            self._mod_sd[slot] = sd
+            self._mod_sd_async[slot] = sd_is_async
+        self._has_async_heartbeats = any(self._mod_hb_async)
+        self.invalidate_status_cache()
+
+    def unregister_module(self, name: str) -> None:
+        """
+        Unload a module by name.
+        """
+        self._modules.pop(name, None)
+        self._hb_fail_count.pop(name, None)
+        self._hb_unchecked_count.pop(name, None)
+        slot = self._mod_index.pop(name, None)
+        if slot is not None:
+            for column in (self._mod_names, self._mod_hb, self._mod_hb_async, self._mod_sd, self._mod_sd_async):
+                del column[slot]
+            for later in self._mod_names[slot:]:
+                self._mod_index[later] -= 1
+        self._has_async_heartbeats = any(self._mod_hb_async)
+        self.invalidate_status_cache()
 
     # ----------------------
     # Health / Heartbeat
@@ -33,58 +268,228 @@ class ISS:
     def heartbeat(self) -> bool:
         """
         Check system health and all loaded modules.
+        Async module heartbeats can only be awaited by heartbeat_async(); when
+        called from inside a running event loop the last heartbeat_async()
+        result is returned instead (see _heartbeat_in_loop()).
         """
+        now = time.monotonic()
+        key = self._cache_key()
+        if key == self._heartbeat_cache_key and now - self._heartbeat_cache_ts < self.status_ttl:
+            return self._heartbeat_cache
+
+        if self._has_async_heartbeats:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.heartbeat_async())
+            return self._heartbeat_in_loop(loop, key)
+
         healthy = self.status == "healthy"
-        for name, module in self.modules.items():
-            hb = getattr(module, "heartbeat", None)
-            if callable(hb):
-                if not hb():
-                    logging.warning(f"⚠️ Module {name} unhealthy")
-                    healthy = False
+        for name, hb in zip(self._mod_names, self._mod_hb):
+            if hb is None:
+                continue
+            if hb():
+                self._hb_recovered(name)
+            else:
+                if self._hb_failed(name):
+                    logger.warning("⚠️ Module %s unhealthy", name)
+                healthy = False
+
+        self._store_heartbeat(healthy, now, key)
         return healthy
 
+    def heartbeat_bool(self) -> bool:
+        """
+        Health verdict only: stops probing at the first unhealthy module and
+        logs nothing. Use heartbeat() when every failing module should be reported.
+        Inside a running event loop it behaves like heartbeat() there.
+        """
+        now = time.monotonic()
+        key = self._cache_key()
+        if key == self._heartbeat_cache_key and now - self._heartbeat_cache_ts < self.status_ttl:
+            return self._heartbeat_cache
+
+        if self._has_async_heartbeats:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return self.heartbeat()
+            return self._heartbeat_in_loop(loop, key)
+
+        healthy = self.status == "healthy" and all(hb() for hb in self._mod_hb if hb is not None)
+
+        self._store_heartbeat(healthy, now, key)
+        return healthy
+
+    async def heartbeat_async(self) -> bool:
+        """
+        Check system health, probing all loaded modules concurrently.
+        Async heartbeats are awaited together; blocking ones run in the executor.
+        """
+        now = time.monotonic()
+        key = self._cache_key()
+        if key == self._heartbeat_cache_key and now - self._heartbeat_cache_ts < self.status_ttl:
+            return self._heartbeat_cache
+
+        loop = asyncio.get_running_loop()
+        names = []
+        probes = []
+        for name, hb, hb_is_async in zip(self._mod_names, self._mod_hb, self._mod_hb_async):
+            if hb is not None:
+                names.append(name)
+                probes.append(hb() if hb_is_async else loop.run_in_executor(None, hb))
+        results = await asyncio.gather(*probes, return_exceptions=True)
+
+        healthy = self.status == "healthy"
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                if self._hb_failed(name):
+                    logger.warning("⚠️ Module %s heartbeat failed: %s", name, result)
+                healthy = False
+            elif not result:
+                if self._hb_failed(name):
+                    logger.warning("⚠️ Module %s unhealthy", name)
+                healthy = False
+            else:
+                self._hb_recovered(name)
+
+        self._hb_unchecked_count.clear()
+        self._store_heartbeat(healthy, now, key)
+        return healthy
+
+    def _heartbeat_in_loop(self, loop, key) -> bool:
+        """
+        Verdict for heartbeat()/heartbeat_bool() inside a running event loop,
+        where async heartbeats cannot be awaited. Returns the last result
+        cached by heartbeat_async() and starts a refresh in the background;
+        until a first result exists the async modules are unchecked, which
+        counts as unhealthy.
+        """
+        if self._heartbeat_refresh is None or self._heartbeat_refresh.done():
+            self._heartbeat_refresh = loop.create_task(self.heartbeat_async())
+        if key == self._heartbeat_cache_key:
+            return self._heartbeat_cache
+
+        for name, hb_is_async in zip(self._mod_names, self._mod_hb_async):
+            if hb_is_async and self._sample(self._hb_unchecked_count, name):
+                logger.warning("⚠️ Module %s async heartbeat not checked yet (awaiting heartbeat_async())", name)
+        return False
+
+    @staticmethod
+    def _sample(counts: dict, name: str) -> bool:
+        """
+        Count one occurrence for name; returns whether it should be logged
+        (the first HB_WARN_FIRST, then every HB_WARN_EVERY-th).
+        """
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        return count < HB_WARN_FIRST or count % HB_WARN_EVERY == 0
+
+    def _hb_failed(self, name: str) -> bool:
+        """Count a failed heartbeat; returns whether this failure should be logged."""
+        return self._sample(self._hb_fail_count, name)
+
+    def _hb_recovered(self, name: str):
+        if self._hb_fail_count.pop(name, None) is not None:
+            logger.info("Module %s healthy again", name)
+
+    def _store_heartbeat(self, healthy: bool, now: float, key):
+        self._heartbeat_cache = healthy
+        self._heartbeat_cache_ts = now
+        self._heartbeat_cache_key = key
+
     async def shutdown(self):
         """
         Gracefully shutdown the ISS system and all modules.
         """
-        logging.info(f"Shutting down {self.system_name}...")
-        
-        # Shutdown all modules
-        for name, module in self.modules.items():
-            shutdown_method = getattr(module, "shutdown", None)
-            if callable(shutdown_method):
-                try:
-                    # Check if the shutdown method is async
-                    import asyncio
-                    if asyncio.iscoroutinefunction(shutdown_method):
-                        await shutdown_method()
-                    else:
-                        shutdown_method()
-                    logging.info(f"Module {name} shutdown complete")
-                except Exception as e:
-                    logging.error(f"Error shutting down module {name}: {e}")
-        
+        logger.info(self._shutdown_start_msg)
+
+        # Shutdown all modules concurrently
+        pending = [
+            (name, shutdown_method, is_async)
+            for name, shutdown_method, is_async in zip(self._mod_names, self._mod_sd, self._mod_sd_async)
+            if shutdown_method is not None
+        ]
+        outcomes = await asyncio.gather(
+            *(self._shutdown_module(shutdown_method, is_async) for _, shutdown_method, is_async in pending)
+        )
+        # One record for the whole phase; per-module detail rides in `extra`
+        failures = [f"{name}: {error}" for (name, _, _), (error, _) in zip(pending, outcomes) if error is not None]
+        level = logging.ERROR if failures else logging.INFO
+        if logger.isEnabledFor(level):
+            results = [(name, error is None, elapsed_ms) for (name, _, _), (error, elapsed_ms) in zip(pending, outcomes)]
+            if failures:
+                logger.error(
+                    "Module shutdown report: %d ok, %d failed (%s)",
+                    len(results) - len(failures), len(failures), "; ".join(failures),
+                    extra={"results": results}
+                )
+            else:
+                logger.info("Module shutdown report: %d ok", len(results), extra={"results": results})
+
+        if self._heartbeat_refresh is not None:
+            self._heartbeat_refresh.cancel()
+            self._heartbeat_refresh = None
+
         self.status = "shutdown"
-        logging.info(f"{self.system_name} shutdown complete")
+        self.invalidate_status_cache()
+        logger.info(self._shutdown_end_msg)
 
-    def get_status(self) -> dict:
+    async def _shutdown_module(self, shutdown_method, is_async: bool):
         """
-        Get comprehensive ISS system status
+        Run one module's shutdown, off the event loop if it is synchronous.
+        Returns (error or None, elapsed_ms).
         """
-        from .utils import current_timecodes
-        
-        timecodes = current_timecodes()
+        start = time.perf_counter()
+        error = None
+        try:
+            if is_async:
+                await asyncio.wait_for(shutdown_method(), timeout=SHUTDOWN_TIMEOUT)
+            else:
+                loop = asyncio.get_running_loop()
+                await asyncio.wait_for(loop.run_in_executor(None, shutdown_method), timeout=SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            error = f"timed out after {SHUTDOWN_TIMEOUT}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return error, round((time.perf_counter() - start) * 1000, 3)
+
+    def status_snapshot(self) -> ISSStatus:
+        """
+        Get comprehensive ISS system status as an ISSStatus.
+        Within status_ttl the same instance is returned again.
+        """
+        now = time.monotonic()
+        key = self._cache_key()
+        if key == self._status_cache_key and now - self._status_cache_ts < self.status_ttl:
+            return self._status_cache
+
+        timecodes = _cached_timecodes()
         
-        return {
-            "system_name": self.system_name,
-            "status": self.status,
-            "modules_loaded": len(self.modules),
-            "module_list": list(self.modules.keys()),
-            "current_stardate": timecodes["stardate"],
-            "current_julian": timecodes["julian_date"],
-            "iso_timestamp": timecodes["iso_timestamp"],
-            "unix_timestamp": timecodes["unix_timestamp"],
-            "heartbeat_healthy": self.heartbeat(),
-            "log_entries": len(self.logs),
-            "time_anchor_hash": timecodes["anchor_hash"]
-        }
+        status = ISSStatus(
+            system_name=self.system_name,
+            status=self.status,
+            modules_loaded=len(self._modules),
+            module_list=tuple(self._mod_names),
+            current_stardate=timecodes["stardate"],
+            current_julian=timecodes["julian_date"],
+            iso_timestamp=timecodes["iso_timestamp"],
+            unix_timestamp=timecodes["unix_timestamp"],
+            heartbeat_healthy=self.heartbeat_bool(),
+            log_entries=len(self.logs),
+            time_anchor_hash=timecodes["anchor_hash"],
+            startup_time=self.startup_time
+        )
+
+        self._status_cache = status
+        self._status_cache_ts = now
+        self._status_cache_key = key
+        return status
+
+    def get_status(self) -> dict:
+        """
+        Get comprehensive ISS system status as a new dict
+        """
+        status = self.status_snapshot()._asdict()
+        status["module_list"] = list(status["module_list"])
+        return status
@@ -10,7 +10,8 @@ from .utils import (
     format_timestamp,
     current_timecodes
 )
-from .ISS import ISS
+from .logging_setup import install_queue_logging, dropped_log_records
+from .ISS import ISS, ISSStatus, HasHeartbeat, HasShutdown
 from .module_loader import ModuleLoader
 from .validators import validate_config, validate_stardate, validate_timestamp
 
@@ -21,7 +22,12 @@ __all__ = [
     "get_market_times",
     "format_timestamp",
     "current_timecodes",
+    "install_queue_logging",
+    "dropped_log_records",
     "ISS",
+    "ISSStatus",
+    "HasHeartbeat",
+    "HasShutdown",
     "ModuleLoader",
     "validate_config",
     "validate_stardate",
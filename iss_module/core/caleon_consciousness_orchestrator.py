@@ -11,14 +11,59 @@ Cycle B: ISS ping harmonizer -> no vault verdict -> dual cochlear processors ->
 """
 
 import asyncio
+import hashlib
 import time
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import random
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, TypedDict
 from datetime import datetime, timezone
-import json
 from pathlib import Path
 
-from .caleon_iss_controller import CaleonISSController
+import aiohttp
+import orjson
+from yarl import URL
+
+from .caleon_iss_controller import CaleonISSController, VaultVerdict
+
+# Cycles allowed to wait between two pipeline stages before the upstream
+# stage blocks; keeps downstream modules from being flooded
+PIPELINE_QUEUE_DEPTH = 4
+
+_PIPELINE_DONE = object()
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Cochlear confirmations of an identical vault verdict are reused for this long
+VERDICT_CACHE_TTL = 2.0
+VERDICT_CACHE_SIZE = 1024
+
+# Cycle A outcomes (confirmation, harmonizer and phonatory replies) for an
+# identical vault verdict are replayed for this long without module calls
+RESOLUTION_CACHE_TTL = 5.0
+RESOLUTION_CACHE_SIZE = 4096
+
+# Outbound requests allowed in flight at once across all modules
+# (CALEON_MAX_INFLIGHT), and per module for the ones that batch best when
+# fed a shallow queue
+MAX_INFLIGHT = int(os.getenv('CALEON_MAX_INFLIGHT', '16'))
+MODULE_INFLIGHT = 4
+
+# Extra attempts for a cochlear processor request that failed or got a 5xx,
+# after a jittered, doubling backoff starting around 1-5ms
+COCHLEAR_RETRIES = 2
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared confirmation whose leading cycle was cancelled; a waiter takes over"""
+
+
+class CochlearConfirmation(TypedDict, total=False):
+    """Cochlear processor's answer on a vault verdict (Cycle A step 3)"""
+    confirmed: bool
+    confidence: float
+    processor_response: Dict[str, Any]
+    error: str  # only when the request failed; confirmed is then False
 
 
 class CaleonConsciousnessCycleOrchestrator:
@@ -40,8 +85,63 @@ class CaleonConsciousnessCycleOrchestrator:
               666,000 synaptic nodes -> cyclonic resonator -> core reasoning hierarchy
     """
     
-    def __init__(self):
+    # Single-request steps: name -> (endpoint attribute, path, constant payload
+    # fields, log emoji, log title, reply fields shown in the log as (label, key))
+    _STEPS = {
+        'verdict_confirmation': (
+            'cochlear_processor_1_url', '/confirm_verdict',
+            {'operation': 'verdict_confirmation'},
+            '🔊', 'Cochlear verdict confirmation', (('Confidence', 'confidence'),)
+        ),
+        'gyro_cortical': (
+            'harmonizer_url', '/gyro_cortical_process',
+            {'operation': 'gyro_cortical_harmonizing', 'mode': 'a_priori_reaffirmation'},
+            '🎵', 'Gyro cortical harmonizing', (('Reaffirmation', 'reaffirmation_status'),)
+        ),
+        'phonatory_output': (
+            'phonatory_output_url', '/generate_output',
+            {'operation': 'final_output', 'output_mode': 'caleon_consciousness'},
+            '🗣️ ', 'Phonatory output generated', (('Output length', 'output_length'),)
+        ),
+        'no_verdict_ping': (
+            'harmonizer_url', '/confirm_no_verdict',
+            {'operation': 'no_verdict_confirmation'},
+            '🎵', 'Harmonizer no-verdict confirmation', ()
+        ),
+        'cyclonic_resonator': (
+            'cyclonic_resonator_url', '/process_synaptic_input',
+            {'operation': 'pyramid_processing', 'total_synaptic_nodes': 999999,
+             'processing_mode': 'full_consciousness'},
+            '🌪️ ', 'Cyclonic resonator processing', (('Layers processed', 'layers_processed'),)
+        ),
+        'final_harmonization': (
+            'harmonizer_url', '/final_gyro_cortical',
+            {'operation': 'final_resolution', 'mode': 'gyro_cortical_final'},
+            '🎵', 'Final gyro cortical harmonization', (('Resolution', 'final_resolution'),)
+        ),
+    }
+    
+    # Cycle B stage results kept in the cycle result, in flow order
+    _CYCLE_B_STAGES = (
+        'dual_cochlear_processing',
+        'synaptic_distribution',
+        'cyclonic_processing',
+        'core_reasoning',
+        'final_harmonization',
+    )
+    
+    def __init__(self, simulation_mode: bool = False, debug_payloads: bool = False):
         self.iss_controller = CaleonISSController("CALEON_CONSCIOUSNESS_ISS")
+        # Bound once; the helpers stamp outgoing payloads with it on every cycle
+        self._get_ts = self.iss_controller.get_microsecond_timestamp
+        
+        # Demo runs may want the synaptic step to take visible time; real
+        # cycles should not pay an artificial delay
+        self.simulation_mode = simulation_mode
+        
+        # Cycle B results keep only a summary of each intermediate stage
+        # (each one embeds its upstream replies); full payloads on request
+        self.debug_payloads = debug_payloads
         
         # Module endpoints - configured for Generation_2.0 structure
         self.cochlear_processor_1_url = "http://localhost:8001"
@@ -56,14 +156,104 @@ class CaleonConsciousnessCycleOrchestrator:
         self.echostack_url = "http://localhost:8043"
         self.echo_ripple_url = "http://localhost:8044"
         
-        # Status tracking
-        self.current_cycle_id = None
-        self.consciousness_active = False
+        # Full endpoint URLs, parsed once and handed to aiohttp as-is: the
+        # single-request steps by step name, then the fan-out targets
+        self._endpoints: Dict[str, URL] = {
+            name: URL(getattr(self, step[0]) + step[1]) for name, step in self._STEPS.items()
+        }
+        self._cochlear_endpoints = (
+            URL(self.cochlear_processor_1_url + "/process_cycle_b"),
+            URL(self.cochlear_processor_2_url + "/process_cycle_b"),
+        )
+        self._core_endpoints = (
+            ('anterior_helix', URL(self.anterior_helix_url + "/process_reasoning")),
+            ('posterior_helix', URL(self.posterior_helix_url + "/process_reasoning")),
+            ('echostack', URL(self.echostack_url + "/process_reasoning")),
+            ('echo_ripple', URL(self.echo_ripple_url + "/process_reasoning")),
+        )
+        
+        # One pooled session for every module call, so keep-alive connections
+        # are reused across steps and cycles; created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # In-flight limits by module (host, port); anything not listed is only
+        # bounded by the global limit. Semaphores are created on first use so
+        # they bind to the running loop.
+        self._inflight_limits: Dict[Tuple[str, int], int] = {
+            (url.host, url.port): MODULE_INFLIGHT
+            for url in map(URL, (self.cochlear_processor_1_url,
+                                 self.cochlear_processor_2_url,
+                                 self.harmonizer_url))
+        }
+        self._out_sema: Optional[asyncio.Semaphore] = None
+        self._module_semas: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        
+        # Constant part of the fan-out requests; the single-request steps keep
+        # theirs in _STEPS. Helpers merge in the per-cycle fields.
+        self._tmpl_cochlear = {'operation': 'dual_processing', 'sync_required': True}
+        self._tmpl_core = {'operation': 'core_reasoning', 'processing_mode': 'parallel_reasoning'}
+        
+        # Verdict confirmations keyed by a hash of the a priori/a posteriori
+        # verdicts: requests still in flight, and recent results (monotonic time, result)
+        self._verdict_inflight: Dict[str, asyncio.Future] = {}
+        self._verdict_results: Dict[str, Tuple[float, bytes]] = {}
+        # Recent Cycle A resolutions as orjson-encoded (cochlear, harmonizer, phonatory) results
+        self._resolution_cache: Dict[str, Tuple[float, bytes]] = {}
+        
+        # Cycles started and not yet finished, in start order (values unused);
+        # several are in flight at once under run_pipelined or concurrent requests
+        self._active_cycles: Dict[str, None] = {}
         
         # Logging
         self.logger = logging.getLogger("CALEON_CONSCIOUSNESS")
         self.logger.info("🧠 CALEON Consciousness Cycle Orchestrator initialized")
     
+    @property
+    def current_cycle_id(self) -> Optional[str]:
+        """Most recently started cycle that is still in flight"""
+        return next(reversed(self._active_cycles), None)
+    
+    @property
+    def consciousness_active(self) -> bool:
+        """Whether any cycle is in flight"""
+        return bool(self._active_cycles)
+    
+    def _begin_cycle(self, cycle_type: str) -> str:
+        """ISS start stamp for a new cycle, tracked until _release_cycle"""
+        cycle_id = self.iss_controller.start_cycle(cycle_type)
+        self._active_cycles[cycle_id] = None
+        return cycle_id
+    
+    def release_cycle(self, cycle_id: str) -> None:
+        """Stop tracking a cycle as in flight (finished, aborted or stopped)"""
+        self._active_cycles.pop(cycle_id, None)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session for module calls (created inside the running loop)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=256,
+                    limit_per_host=64,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def execute_cycle_a(self, input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute Cycle A: A priori/A posteriori verdict processing
@@ -71,27 +261,34 @@ class CaleonConsciousnessCycleOrchestrator:
         Flow: ISS start -> vault check -> verdict found -> cochlear confirmation -> 
               harmonizer gyro cortical -> phonatory output -> cycle clear
         """
+        cycle_id = None
         try:
             # Step 1: ISS records start time
-            cycle_id = self.iss_controller.start_cycle('A')
-            self.current_cycle_id = cycle_id
+            cycle_id = self._begin_cycle('A')
             
-            self.logger.info(f"🔄 Starting CALEON Cycle A - ID: {cycle_id}")
+            self.logger.info("🔄 Starting CALEON Cycle A - ID: %s", cycle_id)
             
             # Step 2: Check A priori and A posteriori vaults for verdict resolution
             vault_verdict = self.iss_controller.check_vault_verdicts(cycle_id)
             
             if not vault_verdict['has_verdict']:
-                self.logger.info(f"ℹ️  No vault verdict found - switching to Cycle B flow")
+                self.logger.info("ℹ️  No vault verdict found - switching to Cycle B flow")
                 return await self.execute_cycle_b(input_data)
             
+            # A verdict resolved moments ago replays its Steps 3-5 outcome; it is
+            # cached encoded, so every replay decodes its own copy of the dicts
+            key = self._verdict_key(vault_verdict)
+            cached = self._resolution_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < RESOLUTION_CACHE_TTL:
+                cochlear_confirmation, harmonizer_response, phonatory_output = orjson.loads(cached[1])
+                return self._finish_cycle_a(cycle_id, vault_verdict, cochlear_confirmation,
+                                            harmonizer_response, phonatory_output, cached=True)
+            
             # Step 3: Verdicts scanned by ISS and fed into cochlear processor for confirmation
-            cochlear_confirmation = await self._cochlear_verdict_confirmation(
-                cycle_id, vault_verdict
-            )
+            cochlear_confirmation = await self._cochlear_verdict_confirmation(cycle_id, vault_verdict)
             
             if not cochlear_confirmation['confirmed']:
-                self.logger.warning(f"⚠️  Cochlear confirmation failed - aborting Cycle A")
+                self.logger.warning("⚠️  Cochlear confirmation failed - aborting Cycle A")
                 return await self._abort_cycle(cycle_id, "cochlear_confirmation_failed")
             
             # Step 4: Pass through straight to harmonizer for gyro cortical harmonizing
@@ -104,33 +301,48 @@ class CaleonConsciousnessCycleOrchestrator:
                 cycle_id, harmonizer_response
             )
             
-            # Step 6: Harmonizer pings ISS for timestamp and clears cycle
-            cycle_clear = self.iss_controller.harmonizer_ping_confirmation(
-                cycle_id, harmonizer_response
-            )
+            if 'error' not in harmonizer_response and 'error' not in phonatory_output:
+                self._ttl_store(self._resolution_cache, key,
+                                orjson.dumps((cochlear_confirmation, harmonizer_response, phonatory_output),
+                                             default=str),
+                                RESOLUTION_CACHE_TTL, RESOLUTION_CACHE_SIZE)
             
-            # Step 7: ISS end cycle timestamping
-            cycle_end_data = self.iss_controller.end_cycle(
-                cycle_id, phonatory_output.get('final_resolution')
-            )
-            
-            self.logger.info(f"✅ CALEON Cycle A completed - Duration: {cycle_end_data['duration_ms']:.3f}ms")
-            
-            return {
-                'cycle_id': cycle_id,
-                'cycle_type': 'A',
-                'status': 'completed',
-                'vault_verdict': vault_verdict,
-                'cochlear_confirmation': cochlear_confirmation,
-                'harmonizer_response': harmonizer_response,
-                'phonatory_output': phonatory_output,
-                'cycle_duration_ms': cycle_end_data['duration_ms'],
-                'drift_status': cycle_end_data['drift_status']
-            }
+            return self._finish_cycle_a(cycle_id, vault_verdict, cochlear_confirmation,
+                                        harmonizer_response, phonatory_output)
             
         except Exception as e:
-            self.logger.error(f"❌ Error in Cycle A: {e}")
+            self.logger.error("❌ Error in Cycle A: %s", e)
             return await self._abort_cycle(cycle_id, f"error: {e}")
+        finally:
+            self.release_cycle(cycle_id)
+    
+    def _finish_cycle_a(self, cycle_id: str, vault_verdict: VaultVerdict,
+                        cochlear_confirmation: CochlearConfirmation, harmonizer_response: Dict[str, Any],
+                        phonatory_output: Dict[str, Any], cached: bool = False) -> Dict[str, Any]:
+        """Steps 6-7 of Cycle A: harmonizer ping and ISS end stamp, then the cycle result"""
+        # Step 6: Harmonizer pings ISS for timestamp and clears cycle
+        self.iss_controller.harmonizer_ping_confirmation(cycle_id, harmonizer_response)
+        
+        # Step 7: ISS end cycle timestamping
+        cycle_end_data = self.iss_controller.end_cycle(
+            cycle_id, phonatory_output.get('final_resolution')
+        )
+        
+        self.logger.info("✅ CALEON Cycle A completed - Duration: %.3fms%s",
+                         cycle_end_data['duration_ms'], " (cached resolution)" if cached else "")
+        
+        return {
+            'cycle_id': cycle_id,
+            'cycle_type': 'A',
+            'status': 'completed',
+            'vault_verdict': vault_verdict,
+            'cochlear_confirmation': cochlear_confirmation,
+            'harmonizer_response': harmonizer_response,
+            'phonatory_output': phonatory_output,
+            'resolution_cached': cached,
+            'cycle_duration_ms': cycle_end_data['duration_ms'],
+            'drift_status': cycle_end_data['drift_status']
+        }
     
     async def execute_cycle_b(self, input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -139,19 +351,19 @@ class CaleonConsciousnessCycleOrchestrator:
         Flow: ISS ping harmonizer -> no vault verdict -> timestamped -> dual cochlear ->
               666,000 synaptic nodes -> cyclonic resonator -> core reasoning hierarchy
         """
+        cycle_id = None
         try:
             # Step 1: ISS records start time
-            cycle_id = self.iss_controller.start_cycle('B')
-            self.current_cycle_id = cycle_id
+            cycle_id = self._begin_cycle('B')
             
-            self.logger.info(f"🔄 Starting CALEON Cycle B - ID: {cycle_id}")
+            self.logger.info("🔄 Starting CALEON Cycle B - ID: %s", cycle_id)
             
             # Step 2: ISS pings harmonizer confirmation that there is no vault verdict
-            harmonizer_no_verdict_confirmation = await self._harmonizer_no_verdict_ping(cycle_id)
-            
             # Step 3: Data is timestamped and sent to Two Cochlear Processors 1 and 2
-            dual_cochlear_processing = await self._dual_cochlear_processing(
-                cycle_id, input_data or {}
+            # The ping carries no data the cochlear step needs, so both run concurrently
+            harmonizer_no_verdict_confirmation, dual_cochlear_processing = await asyncio.gather(
+                self._harmonizer_no_verdict_ping(cycle_id),
+                self._dual_cochlear_processing(cycle_id, input_data or {})
             )
             
             # Step 4: Both processors feed the 666,000 synaptic nodes
@@ -189,216 +401,375 @@ class CaleonConsciousnessCycleOrchestrator:
                 cycle_id, phonatory_output.get('final_resolution')
             )
             
-            self.logger.info(f"✅ CALEON Cycle B completed - Duration: {cycle_end_data['duration_ms']:.3f}ms")
+            self.logger.info("✅ CALEON Cycle B completed - Duration: %.3fms", cycle_end_data['duration_ms'])
             
-            return {
-                'cycle_id': cycle_id,
-                'cycle_type': 'B',
-                'status': 'completed',
+            return self._cycle_b_result(cycle_id, {
                 'dual_cochlear_processing': dual_cochlear_processing,
                 'synaptic_distribution': synaptic_distribution,
                 'cyclonic_processing': cyclonic_processing,
                 'core_reasoning': core_reasoning,
                 'final_harmonization': final_harmonization,
-                'phonatory_output': phonatory_output,
-                'cycle_duration_ms': cycle_end_data['duration_ms'],
-                'drift_status': cycle_end_data['drift_status']
-            }
+                'phonatory_output': phonatory_output
+            }, cycle_end_data)
             
         except Exception as e:
-            self.logger.error(f"❌ Error in Cycle B: {e}")
+            self.logger.error("❌ Error in Cycle B: %s", e)
             return await self._abort_cycle(cycle_id, f"error: {e}")
+        finally:
+            self.release_cycle(cycle_id)
     
-    async def _cochlear_verdict_confirmation(self, cycle_id: str, 
-                                           vault_verdict: Dict[str, Any]) -> Dict[str, Any]:
-        """Step 3: Cochlear processor confirms vault verdict"""
-        import aiohttp
+    async def run_pipelined(self, input_stream: AsyncIterator[Dict[str, Any]],
+                            queue_depth: int = PIPELINE_QUEUE_DEPTH) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run Cycle B over a stream of inputs with the stages overlapped, so the
+        cochlear stage of one input runs while earlier inputs are still in the
+        cyclonic/core reasoning stages. Yields one Cycle B result per input,
+        in input order.
+        """
+        stages = [
+            ('synaptic_distribution',
+             lambda c: self._synaptic_nodes_distribution(c['cycle_id'], c['dual_cochlear_processing'])),
+            ('cyclonic_processing',
+             lambda c: self._cyclonic_resonator_processing(c['cycle_id'], c['synaptic_distribution'])),
+            ('core_reasoning',
+             lambda c: self._core_reasoning_hierarchy(c['cycle_id'], c['cyclonic_processing'])),
+            ('final_harmonization',
+             lambda c: self._final_gyro_cortical_harmonization(c['cycle_id'], c['core_reasoning'])),
+            ('phonatory_output',
+             lambda c: self._phonatory_final_output(c['cycle_id'], c['final_harmonization'])),
+        ]
+        queues = [asyncio.Queue(maxsize=queue_depth) for _ in range(len(stages) + 1)]
+        feed_error = []
+        in_flight = set()  # cycles started but not yet yielded
+        
+        async def feed():
+            # Steps 1-3 of Cycle B: start the cycle, no-verdict ping, dual cochlear
+            try:
+                async for input_data in input_stream:
+                    cycle = {'cycle_id': self._begin_cycle('B')}
+                    in_flight.add(cycle['cycle_id'])
+                    try:
+                        _, cycle['dual_cochlear_processing'] = await asyncio.gather(
+                            self._harmonizer_no_verdict_ping(cycle['cycle_id']),
+                            self._dual_cochlear_processing(cycle['cycle_id'], input_data or {})
+                        )
+                    except Exception as e:
+                        cycle['error'] = e
+                    await queues[0].put(cycle)
+            except Exception as e:
+                feed_error.append(e)
+            finally:
+                await queues[0].put(_PIPELINE_DONE)
+        
+        async def stage_worker(key, step, inbox, outbox):
+            while True:
+                cycle = await inbox.get()
+                if cycle is not _PIPELINE_DONE and 'error' not in cycle:
+                    try:
+                        cycle[key] = await step(cycle)
+                    except Exception as e:
+                        cycle['error'] = e
+                await outbox.put(cycle)
+                if cycle is _PIPELINE_DONE:
+                    return
+        
+        tasks = [asyncio.ensure_future(feed())]
+        tasks += [
+            asyncio.ensure_future(stage_worker(key, step, queues[i], queues[i + 1]))
+            for i, (key, step) in enumerate(stages)
+        ]
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Send verdict to primary cochlear processor for confirmation
-                verdict_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'verdict_confirmation',
-                    'a_priori_verdict': vault_verdict['a_priori'],
-                    'a_posteriori_verdict': vault_verdict['a_posteriori'],
-                    'iss_timestamp': vault_verdict['timestamp']
-                }
+            while True:
+                cycle = await queues[-1].get()
+                if cycle is _PIPELINE_DONE:
+                    break
+                cycle_id = cycle['cycle_id']
+                in_flight.discard(cycle_id)
+                self.release_cycle(cycle_id)
+                if 'error' in cycle:
+                    self.logger.error("❌ Error in pipelined Cycle B: %s", cycle['error'])
+                    yield await self._abort_cycle(cycle_id, f"error: {cycle['error']}")
+                    continue
+                
+                # Harmonizer pings ISS for timestamp and clears cycle, then ISS end stamp
+                self.iss_controller.harmonizer_ping_confirmation(cycle_id, cycle['final_harmonization'])
+                cycle_end_data = self.iss_controller.end_cycle(
+                    cycle_id, cycle['phonatory_output'].get('final_resolution')
+                )
                 
-                async with session.post(
-                    f"{self.cochlear_processor_1_url}/confirm_verdict",
-                    json=verdict_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        confirmation_data = await response.json()
-                        
-                        self.logger.info(f"🔊 Cochlear verdict confirmation - "
-                                       f"Status: {confirmation_data.get('status')} - "
-                                       f"Confidence: {confirmation_data.get('confidence', 0):.3f}")
-                        
-                        return {
-                            'confirmed': confirmation_data.get('status') == 'confirmed',
-                            'confidence': confirmation_data.get('confidence', 0),
-                            'processor_response': confirmation_data
-                        }
-                    else:
-                        self.logger.error(f"❌ Cochlear confirmation failed - Status: {response.status}")
-                        return {'confirmed': False, 'error': f"HTTP {response.status}"}
-                        
+                yield self._cycle_b_result(cycle_id, cycle, cycle_end_data)
+            if feed_error:
+                raise feed_error[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Cycles still in the stages when the consumer stopped get an ISS end stamp too
+            if in_flight:
+                self.logger.warning("🚫 Pipeline stopped with %d cycles in flight; aborting them",
+                                    len(in_flight))
+            for cycle_id in in_flight:
+                self.iss_controller.end_cycle(cycle_id, "ABORTED: pipeline stopped")
+                self.release_cycle(cycle_id)
+    
+    def _cycle_b_result(self, cycle_id: str, stages: Dict[str, Any],
+                        cycle_end_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Completed Cycle B result; intermediate stages are summarized unless debug_payloads"""
+        result = {'cycle_id': cycle_id, 'cycle_type': 'B', 'status': 'completed'}
+        for key in self._CYCLE_B_STAGES:
+            result[key] = stages[key] if self.debug_payloads else self._stage_summary(stages[key])
+        result['phonatory_output'] = stages['phonatory_output']
+        result['cycle_duration_ms'] = cycle_end_data['duration_ms']
+        result['drift_status'] = cycle_end_data['drift_status']
+        return result
+    
+    @staticmethod
+    def _stage_summary(stage_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Status plus a short hash and the encoded size of a stage result"""
+        encoded = orjson.dumps(stage_result, default=str)
+        status = stage_result.get('status')
+        if status is None and 'sync_status' in stage_result:
+            # Dual cochlear processing has no status of its own, only one per processor
+            processor_statuses = (stage_result['processor_1'].get('status'),
+                                  stage_result['processor_2'].get('status'))
+            status = 'error' if 'error' in processor_statuses else stage_result['sync_status']
+        return {
+            'status': status,
+            'sha': hashlib.blake2b(encoded, digest_size=8).hexdigest(),
+            'size': len(encoded)
+        }
+    
+    @staticmethod
+    def _verdict_key(vault_verdict: VaultVerdict) -> str:
+        verdicts = orjson.dumps(
+            [vault_verdict['a_priori'], vault_verdict['a_posteriori']],
+            default=str, option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.blake2b(verdicts, digest_size=16).hexdigest()
+    
+    async def _cochlear_verdict_confirmation(self, cycle_id: str, 
+                                           vault_verdict: VaultVerdict) -> CochlearConfirmation:
+        """
+        Step 3: Cochlear processor confirms vault verdict.
+        Concurrent cycles confirming the same verdicts share one request, and a
+        successful confirmation is reused for VERDICT_CACHE_TTL seconds. Shared
+        and cached results are passed around orjson-encoded, so every cycle
+        decodes its own copy.
+        """
+        key = self._verdict_key(vault_verdict)
+        now = time.monotonic()
+        cached = self._verdict_results.get(key)
+        if cached is not None and now - cached[0] < VERDICT_CACHE_TTL:
+            return orjson.loads(cached[1])
+        
+        while True:
+            pending = self._verdict_inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return orjson.loads(await asyncio.shield(pending))
+            except _LeaderCancelled:
+                continue  # the leading cycle went away before a reply; lead the request ourselves
+        
+        future = asyncio.get_running_loop().create_future()
+        self._verdict_inflight[key] = future
+        try:
+            result = await self._request_verdict_confirmation(cycle_id, vault_verdict)
         except Exception as e:
-            self.logger.error(f"❌ Error in cochlear verdict confirmation: {e}")
-            return {'confirmed': False, 'error': str(e)}
+            future.set_exception(e)
+            raise
+        except BaseException:
+            future.set_exception(_LeaderCancelled())
+            raise
+        finally:
+            self._verdict_inflight.pop(key, None)
+            if future.done():
+                future.exception()  # mark retrieved: there may be no waiters
+        encoded = orjson.dumps(result, default=str)
+        future.set_result(encoded)
+        
+        if 'error' not in result:
+            self._ttl_store(self._verdict_results, key, encoded, VERDICT_CACHE_TTL, VERDICT_CACHE_SIZE)
+        return result
     
-    async def _harmonizer_gyro_cortical_processing(self, cycle_id: str,
-                                                  vault_verdict: Dict[str, Any],
-                                                  cochlear_confirmation: Dict[str, Any]) -> Dict[str, Any]:
-        """Step 4: Harmonizer gyro cortical harmonizing and reaffirmation"""
-        import aiohttp
+    @staticmethod
+    def _ttl_store(cache: Dict[str, tuple], key: str, value: Any, ttl: float, maxsize: int) -> None:
+        """
+        Store value in a dict of key -> (monotonic time, value). A full cache
+        first drops expired entries, then the oldest one if still full.
+        """
+        now = time.monotonic()
+        if len(cache) >= maxsize:
+            for stale in [k for k, (stamp, _) in cache.items() if now - stamp >= ttl]:
+                del cache[stale]
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+        cache.pop(key, None)
+        cache[key] = (now, value)
+    
+    async def _post_json(self, url: URL, payload: Any) -> Tuple[int, Dict[str, Any]]:
+        """
+        POST a JSON payload (a dict, or bytes already encoded) to a module.
+        Returns (status, decoded reply); non-200 replies decode to an error dict.
+        """
+        body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        session = await self._get_session()
+        module_sema = self._module_semaphore(url)
+        if module_sema is not None:
+            await module_sema.acquire()
+        try:
+            async with self._out_sema:
+                async with session.post(url, data=body, headers=_JSON_HEADERS) as response:
+                    data = await response.read()
+                    status = response.status
+        finally:
+            if module_sema is not None:
+                module_sema.release()
         
+        if status == 200:
+            return status, orjson.loads(data)
+        return status, {
+            'error': f"HTTP {status}",
+            'body': data[:256].decode('utf-8', 'replace')
+        }
+    
+    async def _post_json_retrying(self, url: URL, payload: Any,
+                                  retries: int = COCHLEAR_RETRIES) -> Tuple[int, Dict[str, Any]]:
+        """
+        _post_json, retried after a jittered backoff on errors and 5xx replies.
+        The last attempt's reply is returned, or its exception raised.
+        """
+        for attempt in range(retries + 1):
+            try:
+                status, data = await self._post_json(url, payload)
+                if status < 500 or attempt == retries:
+                    return status, data
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == retries:
+                    raise
+            await asyncio.sleep(random.uniform(0.001, 0.005) * 2 ** attempt)
+    
+    def _module_semaphore(self, url: URL) -> Optional[asyncio.Semaphore]:
+        """Per-module in-flight semaphore for url, if its module has a limit"""
+        if self._out_sema is None:
+            self._out_sema = asyncio.Semaphore(MAX_INFLIGHT)
+        module = (url.host, url.port)
+        sema = self._module_semas.get(module)
+        if sema is None:
+            limit = self._inflight_limits.get(module)
+            if limit is None:
+                return None
+            sema = self._module_semas[module] = asyncio.Semaphore(limit)
+        return sema
+    
+    async def _step(self, name: str, cycle_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one single-request step from _STEPS: POST its constant payload plus
+        cycle_id and fields, log the outcome, and return the module's reply
+        ({'status': 'error', 'error': ...} on failure).
+        """
+        _, _, constant, emoji, title, shown = self._STEPS[name]
         try:
-            async with aiohttp.ClientSession() as session:
-                harmonizer_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'gyro_cortical_harmonizing',
-                    'vault_verdict': vault_verdict,
-                    'cochlear_confirmation': cochlear_confirmation,
-                    'mode': 'a_priori_reaffirmation'
-                }
-                
-                async with session.post(
-                    f"{self.harmonizer_url}/gyro_cortical_process",
-                    json=harmonizer_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        harmonizer_data = await response.json()
-                        
-                        self.logger.info(f"🎵 Gyro cortical harmonizing - "
-                                       f"Status: {harmonizer_data.get('status')} - "
-                                       f"Reaffirmation: {harmonizer_data.get('reaffirmation_status')}")
-                        
-                        return harmonizer_data
-                    else:
-                        self.logger.error(f"❌ Harmonizer processing failed - Status: {response.status}")
-                        return {'status': 'error', 'error': f"HTTP {response.status}"}
-                        
+            payload = {'cycle_id': cycle_id, **constant, **fields}
+            status, data = await self._post_json(self._endpoints[name], payload)
+            
+            if status == 200:
+                if self.logger.isEnabledFor(logging.INFO):
+                    details = "".join(f" - {label}: {data.get(key)}" for label, key in shown)
+                    self.logger.info("%s %s - Status: %s%s", emoji, title, data.get('status'), details)
+                return data
+            
+            self.logger.error("❌ %s failed - Status: %s", title, status)
+            return {'status': 'error', 'error': f"HTTP {status}"}
+            
         except Exception as e:
-            self.logger.error(f"❌ Error in harmonizer processing: {e}")
+            self.logger.error("❌ Error in %s: %s", title.lower(), e)
             return {'status': 'error', 'error': str(e)}
     
+    async def _request_verdict_confirmation(self, cycle_id: str,
+                                            vault_verdict: VaultVerdict) -> CochlearConfirmation:
+        """Send a vault verdict to the primary cochlear processor for confirmation"""
+        confirmation_data = await self._step('verdict_confirmation', cycle_id, {
+            'a_priori_verdict': vault_verdict['a_priori'],
+            'a_posteriori_verdict': vault_verdict['a_posteriori'],
+            'iss_timestamp': vault_verdict['timestamp']
+        })
+        if 'error' in confirmation_data:
+            return {'confirmed': False, 'error': confirmation_data['error']}
+        return {
+            'confirmed': confirmation_data.get('status') == 'confirmed',
+            'confidence': confirmation_data.get('confidence', 0),
+            'processor_response': confirmation_data
+        }
+    
+    async def _harmonizer_gyro_cortical_processing(self, cycle_id: str,
+                                                  vault_verdict: VaultVerdict,
+                                                  cochlear_confirmation: CochlearConfirmation) -> Dict[str, Any]:
+        """Step 4: Harmonizer gyro cortical harmonizing and reaffirmation"""
+        return await self._step('gyro_cortical', cycle_id, {
+            'vault_verdict': vault_verdict,
+            'cochlear_confirmation': cochlear_confirmation
+        })
+    
     async def _phonatory_final_output(self, cycle_id: str, 
                                     processing_result: Dict[str, Any]) -> Dict[str, Any]:
         """Step 5: Final approval and output to Phonatory Output module"""
-        import aiohttp
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                phonatory_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'final_output',
-                    'processing_result': processing_result,
-                    'output_mode': 'caleon_consciousness'
-                }
-                
-                async with session.post(
-                    f"{self.phonatory_output_url}/generate_output",
-                    json=phonatory_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        phonatory_data = await response.json()
-                        
-                        self.logger.info(f"🗣️  Phonatory output generated - "
-                                       f"Status: {phonatory_data.get('status')} - "
-                                       f"Output length: {phonatory_data.get('output_length', 0)}")
-                        
-                        return phonatory_data
-                    else:
-                        self.logger.error(f"❌ Phonatory output failed - Status: {response.status}")
-                        return {'status': 'error', 'error': f"HTTP {response.status}"}
-                        
-        except Exception as e:
-            self.logger.error(f"❌ Error in phonatory output: {e}")
-            return {'status': 'error', 'error': str(e)}
+        return await self._step('phonatory_output', cycle_id, {'processing_result': processing_result})
     
     async def _harmonizer_no_verdict_ping(self, cycle_id: str) -> Dict[str, Any]:
         """Step 2 (Cycle B): ISS pings harmonizer confirmation of no vault verdict"""
-        import aiohttp
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                ping_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'no_verdict_confirmation',
-                    'timestamp': self.iss_controller.get_microsecond_timestamp()
-                }
-                
-                async with session.post(
-                    f"{self.harmonizer_url}/confirm_no_verdict",
-                    json=ping_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        confirmation_data = await response.json()
-                        
-                        self.logger.info(f"🎵 Harmonizer no-verdict confirmation - "
-                                       f"Status: {confirmation_data.get('status')}")
-                        
-                        return confirmation_data
-                    else:
-                        self.logger.error(f"❌ Harmonizer no-verdict ping failed - Status: {response.status}")
-                        return {'status': 'error', 'error': f"HTTP {response.status}"}
-                        
-        except Exception as e:
-            self.logger.error(f"❌ Error in harmonizer no-verdict ping: {e}")
-            return {'status': 'error', 'error': str(e)}
+        return await self._step('no_verdict_ping', cycle_id, {
+            'timestamp': self._get_ts()
+        })
+    
+    async def _cyclonic_resonator_processing(self, cycle_id: str,
+                                           synaptic_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 5 (Cycle B): 999,999 synaptic nodes feed the cyclonic resonator"""
+        return await self._step('cyclonic_resonator', cycle_id, {'synaptic_input': synaptic_data})
+    
+    async def _final_gyro_cortical_harmonization(self, cycle_id: str,
+                                                core_reasoning: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 7 (Cycle B): Final gyro cortical harmonizer resolution"""
+        return await self._step('final_harmonization', cycle_id, {'core_reasoning': core_reasoning})
     
     async def _dual_cochlear_processing(self, cycle_id: str, 
                                       input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Step 3 (Cycle B): Data timestamped and sent to dual cochlear processors"""
-        import aiohttp
-        
         try:
             # Prepare synchronized payload with ISS timestamp
-            timestamp = self.iss_controller.get_microsecond_timestamp()
+            timestamp = self._get_ts()
             
             cochlear_payload = {
                 'cycle_id': cycle_id,
-                'operation': 'dual_processing',
+                **self._tmpl_cochlear,
                 'input_data': input_data,
-                'iss_timestamp': timestamp,
-                'sync_required': True
+                'iss_timestamp': timestamp
             }
             
-            # Send to both cochlear processors in parallel
-            async with aiohttp.ClientSession() as session:
-                tasks = [
-                    session.post(f"{self.cochlear_processor_1_url}/process_cycle_b", 
-                               json=cochlear_payload),
-                    session.post(f"{self.cochlear_processor_2_url}/process_cycle_b", 
-                               json=cochlear_payload)
-                ]
-                
-                responses = await asyncio.gather(*tasks)
-                
-                # Process responses
-                processor_1_data = await responses[0].json() if responses[0].status == 200 else {'error': 'failed'}
-                processor_2_data = await responses[1].json() if responses[1].status == 200 else {'error': 'failed'}
+            # Send to both cochlear processors in parallel, encoding the payload once
+            # A failure on one processor no longer cancels the other's request
+            body = orjson.dumps(cochlear_payload)
+            processor_1_data, processor_2_data = [
+                {'status': 'error', 'error': str(response)} if isinstance(response, BaseException)
+                else response[1]
+                for response in await asyncio.gather(
+                    *(self._post_json_retrying(url, body) for url in self._cochlear_endpoints),
+                    return_exceptions=True
+                )
+            ]
                 
-                self.logger.info(f"🔊 Dual cochlear processing - "
-                               f"Processor 1: {processor_1_data.get('status')} - "
-                               f"Processor 2: {processor_2_data.get('status')}")
+            self.logger.info("🔊 Dual cochlear processing - Processor 1: %s - Processor 2: %s",
+                             processor_1_data.get('status'), processor_2_data.get('status'))
                 
-                return {
-                    'processor_1': processor_1_data,
-                    'processor_2': processor_2_data,
-                    'sync_status': 'synchronized',
-                    'timestamp': timestamp
-                }
+            return {
+                'processor_1': processor_1_data,
+                'processor_2': processor_2_data,
+                'sync_status': 'synchronized',
+                'timestamp': timestamp
+            }
                 
         except Exception as e:
-            self.logger.error(f"❌ Error in dual cochlear processing: {e}")
+            self.logger.error("❌ Error in dual cochlear processing: %s", e)
             return {'status': 'error', 'error': str(e)}
     
     async def _synaptic_nodes_distribution(self, cycle_id: str,
@@ -408,152 +779,78 @@ class CaleonConsciousnessCycleOrchestrator:
             # Calculate synaptic distribution based on immutable_core.txt
             # Processor 1: nodes 0-333K, Processor 2: nodes 333K-666K
             
-            synaptic_payload = {
-                'cycle_id': cycle_id,
-                'operation': 'synaptic_distribution',
-                'processor_1_nodes': {'range': '0-333000', 'data': dual_cochlear_data['processor_1']},
-                'processor_2_nodes': {'range': '333000-666000', 'data': dual_cochlear_data['processor_2']},
-                'total_nodes': 666000,
-                'distribution_mode': 'even_split'
-            }
-            
             # Simulate synaptic node distribution (would connect to actual synaptic network)
-            await asyncio.sleep(0.001)  # Simulate microsecond processing
+            if self.simulation_mode:
+                await asyncio.sleep(0.001)
             
-            self.logger.info(f"🧠 Synaptic nodes distribution - "
-                           f"Total nodes: 666,000 - "
-                           f"P1: 0-333K | P2: 333K-666K")
+            self.logger.info("🧠 Synaptic nodes distribution - "
+                             "Total nodes: 666,000 - "
+                             "P1: 0-333K | P2: 333K-666K")
             
-            return {
+            distribution = {
                 'status': 'distributed',
                 'total_nodes_activated': 666000,
                 'processor_1_range': '0-333000',
-                'processor_2_range': '333000-666000',
-                'distribution_payload': synaptic_payload
+                'processor_2_range': '333000-666000'
             }
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error in synaptic distribution: {e}")
-            return {'status': 'error', 'error': str(e)}
-    
-    async def _cyclonic_resonator_processing(self, cycle_id: str,
-                                           synaptic_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Step 5 (Cycle B): 999,999 synaptic nodes feed the cyclonic resonator"""
-        import aiohttp
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                cyclonic_payload = {
+            # The full payload repeats both processors' replies, which the
+            # cyclonic stage would otherwise carry again; only kept for debugging
+            if self.debug_payloads:
+                distribution['distribution_payload'] = {
                     'cycle_id': cycle_id,
-                    'operation': 'pyramid_processing',
-                    'synaptic_input': synaptic_data,
-                    'total_synaptic_nodes': 999999,
-                    'processing_mode': 'full_consciousness'
+                    'operation': 'synaptic_distribution',
+                    'processor_1_nodes': {'range': '0-333000', 'data': dual_cochlear_data['processor_1']},
+                    'processor_2_nodes': {'range': '333000-666000', 'data': dual_cochlear_data['processor_2']},
+                    'total_nodes': 666000,
+                    'distribution_mode': 'even_split'
                 }
-                
-                async with session.post(
-                    f"{self.cyclonic_resonator_url}/process_synaptic_input",
-                    json=cyclonic_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        cyclonic_data = await response.json()
-                        
-                        self.logger.info(f"🌪️  Cyclonic resonator processing - "
-                                       f"Status: {cyclonic_data.get('status')} - "
-                                       f"Layers processed: {cyclonic_data.get('layers_processed', 0)}")
-                        
-                        return cyclonic_data
-                    else:
-                        self.logger.error(f"❌ Cyclonic processing failed - Status: {response.status}")
-                        return {'status': 'error', 'error': f"HTTP {response.status}"}
-                        
+            return distribution
+            
         except Exception as e:
-            self.logger.error(f"❌ Error in cyclonic processing: {e}")
+            self.logger.error("❌ Error in synaptic distribution: %s", e)
             return {'status': 'error', 'error': str(e)}
     
     async def _core_reasoning_hierarchy(self, cycle_id: str,
                                       cyclonic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Step 6 (Cycle B): Core reasoning hierarchy processing"""
-        import aiohttp
-        
         try:
             # Send to all 4 core reasoning modules as specified in immutable_core.txt
-            async with aiohttp.ClientSession() as session:
-                core_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'core_reasoning',
-                    'cyclonic_input': cyclonic_data,
-                    'processing_mode': 'parallel_reasoning'
-                }
-                
-                # Parallel processing across all core modules
-                tasks = [
-                    session.post(f"{self.anterior_helix_url}/process_reasoning", json=core_payload),
-                    session.post(f"{self.posterior_helix_url}/process_reasoning", json=core_payload),
-                    session.post(f"{self.echostack_url}/process_reasoning", json=core_payload),
-                    session.post(f"{self.echo_ripple_url}/process_reasoning", json=core_payload)
-                ]
+            core_payload = {
+                'cycle_id': cycle_id,
+                **self._tmpl_core,
+                'cyclonic_input': cyclonic_data
+            }
                 
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
+            # Parallel processing across all core modules; the payload (which
+            # embeds the whole cyclonic response) is encoded once for all four
+            body = orjson.dumps(core_payload)
+            responses = await asyncio.gather(
+                *(self._post_json(url, body) for _, url in self._core_endpoints),
+                return_exceptions=True
+            )
                 
-                # Process core reasoning responses
-                core_results = {
-                    'anterior_helix': await responses[0].json() if hasattr(responses[0], 'status') and responses[0].status == 200 else {'error': 'failed'},
-                    'posterior_helix': await responses[1].json() if hasattr(responses[1], 'status') and responses[1].status == 200 else {'error': 'failed'},
-                    'echostack': await responses[2].json() if hasattr(responses[2], 'status') and responses[2].status == 200 else {'error': 'failed'},
-                    'echo_ripple': await responses[3].json() if hasattr(responses[3], 'status') and responses[3].status == 200 else {'error': 'failed'}
-                }
+            # Process core reasoning responses
+            core_results = {
+                name: {'error': 'failed'} if isinstance(response, BaseException) else response[1]
+                for (name, _), response in zip(self._core_endpoints, responses)
+            }
                 
-                self.logger.info(f"🧬 Core reasoning hierarchy - "
-                               f"Anterior: {core_results['anterior_helix'].get('status')} - "
-                               f"Posterior: {core_results['posterior_helix'].get('status')} - "
-                               f"EchoStack: {core_results['echostack'].get('status')} - "
-                               f"Echo Ripple: {core_results['echo_ripple'].get('status')}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("🧬 Core reasoning hierarchy - Anterior: %s - Posterior: %s - "
+                                 "EchoStack: %s - Echo Ripple: %s",
+                                 core_results['anterior_helix'].get('status'),
+                                 core_results['posterior_helix'].get('status'),
+                                 core_results['echostack'].get('status'),
+                                 core_results['echo_ripple'].get('status'))
                 
-                return {
-                    'status': 'processed',
-                    'core_results': core_results,
-                    'reasoning_complete': True
-                }
-                
-        except Exception as e:
-            self.logger.error(f"❌ Error in core reasoning hierarchy: {e}")
-            return {'status': 'error', 'error': str(e)}
-    
-    async def _final_gyro_cortical_harmonization(self, cycle_id: str,
-                                                core_reasoning: Dict[str, Any]) -> Dict[str, Any]:
-        """Step 7 (Cycle B): Final gyro cortical harmonizer resolution"""
-        import aiohttp
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                harmonizer_payload = {
-                    'cycle_id': cycle_id,
-                    'operation': 'final_resolution',
-                    'core_reasoning': core_reasoning,
-                    'mode': 'gyro_cortical_final'
-                }
+            return {
+                'status': 'processed',
+                'core_results': core_results,
+                'reasoning_complete': True
+            }
                 
-                async with session.post(
-                    f"{self.harmonizer_url}/final_gyro_cortical",
-                    json=harmonizer_payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        harmonizer_data = await response.json()
-                        
-                        self.logger.info(f"🎵 Final gyro cortical harmonization - "
-                                       f"Status: {harmonizer_data.get('status')} - "
-                                       f"Resolution: {harmonizer_data.get('final_resolution')}")
-                        
-                        return harmonizer_data
-                    else:
-                        self.logger.error(f"❌ Final harmonization failed - Status: {response.status}")
-                        return {'status': 'error', 'error': f"HTTP {response.status}"}
-                        
         except Exception as e:
-            self.logger.error(f"❌ Error in final harmonization: {e}")
+            self.logger.error("❌ Error in core reasoning hierarchy: %s", e)
             return {'status': 'error', 'error': str(e)}
     
     async def _abort_cycle(self, cycle_id: str, reason: str) -> Dict[str, Any]:
@@ -562,17 +859,17 @@ class CaleonConsciousnessCycleOrchestrator:
             if cycle_id:
                 self.iss_controller.end_cycle(cycle_id, f"ABORTED: {reason}")
             
-            self.logger.error(f"🚫 Cycle {cycle_id} aborted: {reason}")
+            self.logger.error("🚫 Cycle %s aborted: %s", cycle_id, reason)
             
             return {
                 'cycle_id': cycle_id,
                 'status': 'aborted',
                 'reason': reason,
-                'timestamp': self.iss_controller.get_microsecond_timestamp()
+                'timestamp': self._get_ts()
             }
             
         except Exception as e:
-            self.logger.error(f"❌ Error aborting cycle: {e}")
+            self.logger.error("❌ Error aborting cycle: %s", e)
             return {'cycle_id': cycle_id, 'status': 'abort_failed', 'error': str(e)}
     
     def get_consciousness_status(self) -> Dict[str, Any]:
@@ -592,23 +889,29 @@ class CaleonConsciousnessCycleOrchestrator:
 
 async def main():
     """Example usage of CALEON Consciousness Cycle Orchestrator"""
-    orchestrator = CaleonConsciousnessCycleOrchestrator()
-    
-    # Example Cycle A execution (vault verdict found)
-    print("🧠 Starting CALEON Consciousness Cycle A simulation...")
-    cycle_a_result = await orchestrator.execute_cycle_a()
-    print(f"Cycle A Result: {cycle_a_result['status']}")
-    
-    # Example Cycle B execution (no vault verdict, full processing)
-    print("🧠 Starting CALEON Consciousness Cycle B simulation...")
-    cycle_b_input = {'audio_input': 'test_consciousness_input', 'context': 'simulation'}
-    cycle_b_result = await orchestrator.execute_cycle_b(cycle_b_input)
-    print(f"Cycle B Result: {cycle_b_result['status']}")
-    
-    # Get consciousness status
-    status = orchestrator.get_consciousness_status()
-    print(f"CALEON Consciousness Status: {status}")
+    async with CaleonConsciousnessCycleOrchestrator() as orchestrator:
+        # Example Cycle A execution (vault verdict found)
+        print("🧠 Starting CALEON Consciousness Cycle A simulation...")
+        cycle_a_result = await orchestrator.execute_cycle_a()
+        print(f"Cycle A Result: {cycle_a_result['status']}")
+        
+        # Example Cycle B execution (no vault verdict, full processing)
+        print("🧠 Starting CALEON Consciousness Cycle B simulation...")
+        cycle_b_input = {'audio_input': 'test_consciousness_input', 'context': 'simulation'}
+        cycle_b_result = await orchestrator.execute_cycle_b(cycle_b_input)
+        print(f"Cycle B Result: {cycle_b_result['status']}")
+        
+        # Get consciousness status
+        status = orchestrator.get_consciousness_status()
+        print(f"CALEON Consciousness Status: {status}")
 
 
 if __name__ == "__main__":
+    # uvloop when installed (pulled in by uvicorn[standard] on Linux/macOS);
+    # the stock asyncio loop elsewhere, e.g. Windows
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -12,21 +12,82 @@ Key Features:
 - Complete audit trail for CALEON's consciousness flow
 """
 
+import atexit
+import hashlib
+import itertools
+import os
+import struct
 import time
-import json
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, TypedDict
 from pathlib import Path
 import threading
-from dataclasses import dataclass, asdict
+import weakref
+from dataclasses import dataclass
+
+import orjson
+
+from .logging_setup import install_queue_logging
 
 from .utils import (
     get_stardate,
+    stardate_at,
     current_timecodes,
     ensure_folder,
 )
 
+# Audit JSONL records are buffered and appended in batches by the flush
+# thread: shortly after the first pending record, or at once when a file has
+# a full batch
+CYCLE_LOG_FLUSH_INTERVAL = 0.005
+CYCLE_LOG_BATCH = 256
+
+# After a failed write the flush thread waits this long before retrying;
+# the failed batch stays queued in the meantime
+CYCLE_LOG_RETRY_INTERVAL = 1.0
+
+# Most lines kept queued per file while its writes fail; past this the
+# oldest are dropped (and counted in dropped_records)
+CYCLE_LOG_MAX_PENDING = 65536
+
+# Start stamps kept for cycles that have not ended; a cycle that is never
+# ended (e.g. Cycle A handing over to Cycle B) is dropped oldest-first
+MAX_OPEN_CYCLES = 4096
+
+# Vault scans read only this much from the end of the file (more if the
+# newest entries are larger) and look at the last VAULT_SCAN_ENTRIES lines
+VAULT_TAIL_BYTES = 65536
+VAULT_SCAN_ENTRIES = 10
+
+# Per-call anchor input: unix ns, stardate, cycle counter
+_ANCHOR_FIELDS = struct.Struct("<qdQ")
+
+# Controllers not yet closed; one exit hook closes them all without keeping
+# closed controllers alive
+_open_controllers: "weakref.WeakSet[CaleonISSController]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_controllers():
+    for controller in list(_open_controllers):
+        controller.close()
+
+
+class VaultScan(TypedDict):
+    """One vault's scan result"""
+    found: bool
+    status: str  # 'active_verdict', 'no_active_verdict', 'empty' or 'error'
+    verdict: Optional[Dict[str, Any]]
+
+
+class VaultVerdict(TypedDict):
+    """Result of checking both vaults at the start of a cycle"""
+    a_priori: VaultScan
+    a_posteriori: VaultScan
+    has_verdict: bool
+    timestamp: Dict[str, Any]  # get_microsecond_timestamp() record
+
 
 @dataclass
 class CaleonCycleTimestamp:
@@ -57,8 +118,16 @@ class CaleonISSController:
     
     def __init__(self, system_name: str = "CALEON_ISS"):
         self.system_name = system_name
+        
+        # Initialize logging (root output via the background queue listener)
+        install_queue_logging()
+        self.logger = logging.getLogger(f"{system_name}")
+        
         self.status = "healthy"
         self.cycle_counter = 0
+        self._cycle_numbers = itertools.count(1)  # next() is atomic, so no lock to number cycles
+        # Most recently started cycle, for reporting only: concurrent cycles
+        # are told apart by cycle_id (see _open_cycles)
         self.current_cycle_id = None
         self.current_cycle_type = None
         
@@ -72,28 +141,55 @@ class CaleonISSController:
         self.cycle_log_path = Path(self.log_folder) / "caleon_cycle_timestamps.jsonl"
         self.drift_log_path = Path(self.log_folder) / "caleon_drift_monitoring.jsonl"
         
-        # Thread safety
+        # Thread safety (guards the open-cycle map and cycle_counter; numbering is lock-free)
         self._lock = threading.Lock()
         
-        # Drift monitoring
+        # Encoded JSONL lines waiting to be appended, per file. _log_lock only
+        # guards the pending lists (and drift statistics); _write_lock is held
+        # across the file writes so batches land in order
+        self._pending: Dict[Path, List[bytes]] = {}
+        self.dropped_records = 0
+        self._log_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._flush_now = threading.Event()  # a full batch is waiting: skip the flush interval
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_worker, name=f"{system_name}-flush", daemon=True)
+        self._flush_thread.start()
+        
+        # O_APPEND descriptors for those files, opened on first write and kept
+        self._fds: Dict[Path, int] = {}
+        _open_controllers.add(self)
+        
+        # Last scan of each vault, reused while its (mtime, size) is unchanged
+        self._vault_scans: Dict[Path, tuple] = {}
+        
+        # (start timestamp in microseconds, cycle type) of each cycle not yet ended
+        self._open_cycles: Dict[str, Tuple[float, str]] = {}
+        
+        # Running drift statistics over the records logged by this instance.
+        # Earlier runs' drift_ns values are not folded in: older logs measured
+        # a different quantity, and reading them back would cost a full pass
+        self._drift_sum = 0.0
+        self._drift_count = 0
+        self._drift_max: Optional[float] = None
+        self._drift_min: Optional[float] = None
+        
+        # Drift monitoring: wall clock against the monotonic clock since baseline
         self.baseline_time = time.time_ns()
+        self._baseline_perf_ns = time.perf_counter_ns()
+        self._clock_offset_ns = self.baseline_time - self._baseline_perf_ns
         self.baseline_stardate = get_stardate()
         
-        # Initialize logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(f"{system_name}")
+        # Anchor hash state with the constant prefix already absorbed
+        self._anchor_hash = hashlib.blake2b(b"CALEON-", digest_size=8)
         
-        self.logger.info(f"✅ CALEON ISS Controller initialized - Zero drift baseline established")
+        self.logger.info("✅ CALEON ISS Controller initialized - Zero drift baseline established")
     
     def get_microsecond_timestamp(self) -> Dict[str, Any]:
         """Generate microsecond precision timestamp with all CALEON timing data"""
-        now_ns = time.time_ns()
-        now_dt = datetime.now(timezone.utc)
-        stardate = get_stardate()
-        
-        # Calculate drift from baseline
-        expected_time = self.baseline_time + (stardate - self.baseline_stardate) * 86400 * 1e9
-        drift_ns = now_ns - expected_time
+        now_ns, stardate, drift_ns = self._sample_clock()
+        now_dt = datetime.fromtimestamp(now_ns / 1e9, timezone.utc)
         
         return {
             'timestamp_microseconds': now_ns / 1000.0,  # Convert to microseconds
@@ -101,14 +197,34 @@ class CaleonISSController:
             'stardate': stardate,
             'unix_timestamp_ns': now_ns,
             'drift_ns': drift_ns,
-            'anchor_hash': self._generate_cycle_anchor(now_dt, stardate)
+            'anchor_hash': self._generate_cycle_anchor(now_ns, stardate)
+        }
+    
+    def _sample_clock(self):
+        """
+        One clock sample as (unix ns, stardate, drift ns). Drift is how far the
+        wall clock has moved against the monotonic clock since the baseline
+        (NTP steps and slews), in integer nanoseconds.
+        """
+        now_ns = time.time_ns()
+        drift_ns = now_ns - time.perf_counter_ns() - self._clock_offset_ns
+        return now_ns, stardate_at(now_ns / 1e9), drift_ns
+    
+    def _record_timestamp(self) -> Dict[str, Any]:
+        """Timing fields for audit records that never leave the controller (no ISO/anchor)"""
+        now_ns, stardate, drift_ns = self._sample_clock()
+        return {
+            'timestamp_microseconds': now_ns / 1000.0,
+            'stardate': stardate,
+            'unix_timestamp_ns': now_ns,
+            'drift_ns': drift_ns
         }
     
-    def _generate_cycle_anchor(self, dt: datetime, stardate: float) -> str:
-        """Generate unique anchor hash for cycle tracking"""
-        import hashlib
-        anchor_string = f"CALEON-{dt.isoformat()}-{stardate}-{self.cycle_counter}"
-        return hashlib.sha256(anchor_string.encode()).hexdigest()[:16]
+    def _generate_cycle_anchor(self, now_ns: int, stardate: float) -> str:
+        """Generate unique anchor hash for cycle tracking (an ID, not a security hash)"""
+        anchor = self._anchor_hash.copy()
+        anchor.update(_ANCHOR_FIELDS.pack(now_ns, stardate, self.cycle_counter))
+        return anchor.hexdigest()
     
     def start_cycle(self, cycle_type: str) -> str:
         """
@@ -120,32 +236,48 @@ class CaleonISSController:
         Returns:
             cycle_id: Unique identifier for this cycle
         """
+        cycle_number = next(self._cycle_numbers)
+        cycle_id = f"CALEON_C{cycle_number:06d}_{cycle_type}"
+        self.current_cycle_id = cycle_id
+        self.current_cycle_type = cycle_type
+        
+        timestamp_data = self._record_timestamp()
+        
+        cycle_record = CaleonCycleTimestamp(
+            cycle_id=cycle_id,
+            cycle_type=cycle_type,
+            timestamp_microseconds=timestamp_data['timestamp_microseconds'],
+            stardate=timestamp_data['stardate'],
+            operation='cycle_start',
+            drift_ns=timestamp_data['drift_ns']
+        )
+        
+        self._log_cycle_event(cycle_record)
+        
         with self._lock:
-            self.cycle_counter += 1
-            cycle_id = f"CALEON_C{self.cycle_counter:06d}_{cycle_type}"
-            self.current_cycle_id = cycle_id
-            self.current_cycle_type = cycle_type
-            
-            timestamp_data = self.get_microsecond_timestamp()
-            
-            cycle_record = CaleonCycleTimestamp(
-                cycle_id=cycle_id,
-                cycle_type=cycle_type,
-                timestamp_microseconds=timestamp_data['timestamp_microseconds'],
-                stardate=timestamp_data['stardate'],
-                operation='cycle_start',
-                drift_ns=timestamp_data['drift_ns']
-            )
-            
-            self._log_cycle_event(cycle_record)
-            
-            self.logger.info(f"🔄 CYCLE START [{cycle_type}] - ID: {cycle_id} - "
-                           f"Timestamp: {timestamp_data['timestamp_microseconds']:.3f}μs - "
-                           f"Drift: {timestamp_data['drift_ns']:.2f}ns")
-            
-            return cycle_id
+            # Numbers can be handed out in one order and reach here in another
+            self.cycle_counter = max(self.cycle_counter, cycle_number)
+            if len(self._open_cycles) >= MAX_OPEN_CYCLES:
+                del self._open_cycles[next(iter(self._open_cycles))]
+            self._open_cycles[cycle_id] = (timestamp_data['timestamp_microseconds'], cycle_type)
+        
+        self.logger.info("🔄 CYCLE START [%s] - ID: %s - Timestamp: %.3fμs - Drift: %.2fns",
+                         cycle_type, cycle_id, timestamp_data['timestamp_microseconds'],
+                         timestamp_data['drift_ns'])
+        
+        return cycle_id
+    
+    def _cycle_type(self, cycle_id: Optional[str]) -> Optional[str]:
+        """Type of an open cycle, else the type suffix of a controller-issued cycle_id"""
+        if cycle_id is None:
+            return None
+        opened = self._open_cycles.get(cycle_id)
+        if opened is not None:
+            return opened[1]
+        suffix = cycle_id.rpartition('_')[2]
+        return suffix if cycle_id.startswith('CALEON_C') and suffix else None
     
-    def check_vault_verdicts(self, cycle_id: str) -> Dict[str, Any]:
+    def check_vault_verdicts(self, cycle_id: str) -> VaultVerdict:
         """
         Check A priori and A posteriori vaults for verdict resolution.
         Implements immutable_core.txt vault scanning requirement.
@@ -161,7 +293,7 @@ class CaleonISSController:
         # Log vault check operation
         vault_check_record = CaleonCycleTimestamp(
             cycle_id=cycle_id,
-            cycle_type=self.current_cycle_type,
+            cycle_type=self._cycle_type(cycle_id),
             timestamp_microseconds=timestamp_data['timestamp_microseconds'],
             stardate=timestamp_data['stardate'],
             operation='vault_check',
@@ -178,56 +310,87 @@ class CaleonISSController:
             'timestamp': timestamp_data
         }
         
-        self.logger.info(f"🗃️  VAULT CHECK [{cycle_id}] - A priori: {a_priori_verdict['status']} | "
-                        f"A posteriori: {a_posteriori_verdict['status']} - "
-                        f"Timestamp: {timestamp_data['timestamp_microseconds']:.3f}μs")
+        self.logger.info("🗃️  VAULT CHECK [%s] - A priori: %s | A posteriori: %s - Timestamp: %.3fμs",
+                         cycle_id, a_priori_verdict['status'], a_posteriori_verdict['status'],
+                         timestamp_data['timestamp_microseconds'])
         
         return verdict_result
     
-    def _scan_vault(self, vault_path: Path, vault_type: str) -> Dict[str, Any]:
-        """Scan a specific vault for existing verdicts"""
-        if not vault_path.exists():
+    def _scan_vault(self, vault_path: Path, vault_type: str) -> VaultScan:
+        """Scan a specific vault for existing verdicts (a fresh dict per call; the scan itself is cached)"""
+        try:
+            stat = vault_path.stat()
+        except FileNotFoundError:
             return {'found': False, 'status': 'empty', 'verdict': None}
         
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._vault_scans.get(vault_path)
+        if cached is not None and cached[0] == cache_key:
+            return dict(cached[1])
+        
         try:
-            # Read last few entries to check for recent verdicts
-            with open(vault_path, 'r') as f:
-                lines = f.readlines()
-                
-            if not lines:
-                return {'found': False, 'status': 'empty', 'verdict': None}
-            
-            # Check last 10 entries for active verdicts
-            recent_entries = lines[-10:] if len(lines) >= 10 else lines
+            # Check the last few entries for an active verdict
+            result: VaultScan = {'found': False, 'status': 'no_active_verdict', 'verdict': None}
+            recent_entries = self._read_vault_tail(vault_path, stat.st_size)
+            if not recent_entries:
+                result = {'found': False, 'status': 'empty', 'verdict': None}
             
             for line in reversed(recent_entries):
                 try:
-                    entry = json.loads(line.strip())
+                    entry = orjson.loads(line)
                     if entry.get('verdict_active', False):
-                        return {
+                        result = {
                             'found': True, 
                             'status': 'active_verdict',
                             'verdict': entry
                         }
-                except json.JSONDecodeError:
+                        break
+                except orjson.JSONDecodeError:
                     continue
             
-            return {'found': False, 'status': 'no_active_verdict', 'verdict': None}
+            self._vault_scans[vault_path] = (cache_key, result)
+            return dict(result)
             
         except Exception as e:
-            self.logger.error(f"❌ Error scanning {vault_type} vault: {e}")
+            self.logger.error("❌ Error scanning %s vault: %s", vault_type, e)
             return {'found': False, 'status': 'error', 'verdict': None}
     
-    def harmonizer_ping_confirmation(self, cycle_id: str, harmonizer_response: Dict[str, Any]) -> bool:
+    def _read_vault_tail(self, vault_path: Path, size: int) -> List[bytes]:
+        """
+        Last VAULT_SCAN_ENTRIES lines of a vault, read with pread from the end
+        of the file; the window doubles until it holds that many whole lines.
+        """
+        window = VAULT_TAIL_BYTES
+        fd = os.open(vault_path, os.O_RDONLY)
+        try:
+            while True:
+                offset = max(0, size - window)
+                lines = os.pread(fd, size - offset, offset).splitlines()
+                if offset > 0 and lines:
+                    # The first line is most likely cut in half by the offset
+                    lines = lines[1:]
+                if offset == 0 or len(lines) >= VAULT_SCAN_ENTRIES:
+                    return lines[-VAULT_SCAN_ENTRIES:]
+                window *= 2
+        finally:
+            os.close(fd)
+    
+    def harmonizer_ping_confirmation(self, cycle_id: str, harmonizer_response: Dict[str, Any],
+                                     timestamp_data: Optional[Dict[str, Any]] = None) -> bool:
         """
         Log harmonizer ping confirmation as required by immutable_core.txt.
         Harmonizer pings ISS for timestamp and cycle clearance.
+        
+        Args:
+            timestamp_data: Timestamp already taken by the caller, reused so the
+                            log record and the caller's response share one value
         """
-        timestamp_data = self.get_microsecond_timestamp()
+        if timestamp_data is None:
+            timestamp_data = self._record_timestamp()
         
         harmonizer_record = CaleonCycleTimestamp(
             cycle_id=cycle_id,
-            cycle_type=self.current_cycle_type,
+            cycle_type=self._cycle_type(cycle_id),
             timestamp_microseconds=timestamp_data['timestamp_microseconds'],
             stardate=timestamp_data['stardate'],
             operation='harmonizer_ping',
@@ -240,25 +403,27 @@ class CaleonISSController:
         
         cycle_cleared = harmonizer_response.get('cycle_clear', True)
         
-        self.logger.info(f"🎵 HARMONIZER PING [{cycle_id}] - Response: {harmonizer_response.get('status')} - "
-                        f"Cycle Clear: {cycle_cleared} - "
-                        f"Timestamp: {timestamp_data['timestamp_microseconds']:.3f}μs")
+        self.logger.info("🎵 HARMONIZER PING [%s] - Response: %s - Cycle Clear: %s - Timestamp: %.3fμs",
+                         cycle_id, harmonizer_response.get('status'), cycle_cleared,
+                         timestamp_data['timestamp_microseconds'])
         
         return cycle_cleared
     
-    def end_cycle(self, cycle_id: str, final_resolution: Optional[str] = None) -> Dict[str, Any]:
+    def end_cycle(self, cycle_id: str, final_resolution: Optional[str] = None,
+                  timestamp_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         End CALEON consciousness cycle with final timestamping.
         Implements zero drift expectation monitoring.
         """
-        if cycle_id != self.current_cycle_id:
-            self.logger.warning(f"⚠️  Cycle ID mismatch: Expected {self.current_cycle_id}, got {cycle_id}")
+        if timestamp_data is None:
+            timestamp_data = self.get_microsecond_timestamp()
         
-        timestamp_data = self.get_microsecond_timestamp()
+        with self._lock:
+            opened = self._open_cycles.pop(cycle_id, None)
         
         cycle_end_record = CaleonCycleTimestamp(
             cycle_id=cycle_id,
-            cycle_type=self.current_cycle_type,
+            cycle_type=opened[1] if opened is not None else self._cycle_type(cycle_id),
             timestamp_microseconds=timestamp_data['timestamp_microseconds'],
             stardate=timestamp_data['stardate'],
             operation='cycle_end',
@@ -269,16 +434,21 @@ class CaleonISSController:
         self._log_cycle_event(cycle_end_record)
         
         # Calculate cycle duration and log for drift monitoring
-        cycle_duration = self._calculate_cycle_duration(cycle_id)
-        
-        self.logger.info(f"🏁 CYCLE END [{cycle_id}] - Duration: {cycle_duration:.3f}ms - "
-                        f"Final Resolution: {final_resolution} - "
-                        f"Timestamp: {timestamp_data['timestamp_microseconds']:.3f}μs - "
-                        f"Drift: {timestamp_data['drift_ns']:.2f}ns")
-        
-        # Reset current cycle tracking
-        self.current_cycle_id = None
-        self.current_cycle_type = None
+        if opened is None:
+            self.logger.warning("⚠️  No start timestamp for cycle %s - duration unknown", cycle_id)
+            cycle_duration = 0.0
+        else:
+            cycle_duration = (timestamp_data['timestamp_microseconds'] - opened[0]) / 1000.0  # Convert to milliseconds
+        
+        self.logger.info("🏁 CYCLE END [%s] - Duration: %.3fms - Final Resolution: %s - "
+                         "Timestamp: %.3fμs - Drift: %.2fns",
+                         cycle_id, cycle_duration, final_resolution,
+                         timestamp_data['timestamp_microseconds'], timestamp_data['drift_ns'])
+        
+        # Reset current cycle tracking unless a newer cycle has started since
+        if self.current_cycle_id == cycle_id:
+            self.current_cycle_id = None
+            self.current_cycle_type = None
         
         return {
             'cycle_id': cycle_id,
@@ -287,53 +457,135 @@ class CaleonISSController:
             'drift_status': 'acceptable' if abs(timestamp_data['drift_ns']) < 1000 else 'warning'
         }
     
-    def _calculate_cycle_duration(self, cycle_id: str) -> float:
-        """Calculate duration of a cycle from start to end timestamps"""
-        try:
-            start_timestamp = None
-            end_timestamp = None
-            
-            with open(self.cycle_log_path, 'r') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                        if record['cycle_id'] == cycle_id:
-                            if record['operation'] == 'cycle_start':
-                                start_timestamp = record['timestamp_microseconds']
-                            elif record['operation'] == 'cycle_end':
-                                end_timestamp = record['timestamp_microseconds']
-                    except json.JSONDecodeError:
-                        continue
-            
-            if start_timestamp and end_timestamp:
-                return (end_timestamp - start_timestamp) / 1000.0  # Convert to milliseconds
-            
-            return 0.0
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error calculating cycle duration: {e}")
-            return 0.0
-    
     def _log_cycle_event(self, cycle_record: CaleonCycleTimestamp):
         """Log cycle event to timestamped audit trail"""
         try:
-            with open(self.cycle_log_path, 'a') as f:
-                f.write(json.dumps(asdict(cycle_record)) + '\n')
+            if cycle_record.drift_ns is not None:
+                with self._log_lock:
+                    self._add_drift_sample(cycle_record.drift_ns)
+            self._append_record(self.cycle_log_path, cycle_record)
         except Exception as e:
-            self.logger.error(f"❌ Error logging cycle event: {e}")
+            self.logger.error("❌ Error logging cycle event: %s", e)
+    
+    def _add_drift_sample(self, drift_ns: float):
+        """Fold one drift sample into the running statistics (caller holds _log_lock)"""
+        self._drift_sum += drift_ns
+        self._drift_count += 1
+        if self._drift_max is None or drift_ns > self._drift_max:
+            self._drift_max = drift_ns
+        if self._drift_min is None or drift_ns < self._drift_min:
+            self._drift_min = drift_ns
+    
+    def _append_record(self, path: Path, record: Any):
+        """Queue one JSONL record (a dict or dataclass) for path; the flush thread writes it out"""
+        line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        with self._log_lock:
+            pending = self._pending.setdefault(path, [])
+            pending.append(line)
+            self._trim_pending(pending)
+            full = len(pending) >= CYCLE_LOG_BATCH
+        # Never written here: callers include the event loop
+        if full:
+            self._flush_now.set()
+        self._flush_wakeup.set()
+    
+    def flush(self, path: Optional[Path] = None) -> bool:
+        """
+        Append buffered records to their files (only path's, if given).
+        A batch that cannot be written is queued again ahead of newer records
+        (up to CYCLE_LOG_MAX_PENDING lines per file); returns False if any batch failed.
+        """
+        with self._write_lock:
+            with self._log_lock:
+                if path is None:
+                    batches = list(self._pending.items())
+                    self._pending.clear()
+                else:
+                    lines = self._pending.pop(path, None)
+                    batches = [(path, lines)] if lines else []
+            
+            ok = True
+            for batch_path, lines in batches:
+                try:
+                    self._write_lines(batch_path, lines)
+                except Exception as e:
+                    ok = False
+                    with self._log_lock:
+                        pending = lines + self._pending.get(batch_path, [])
+                        self._trim_pending(pending)
+                        self._pending[batch_path] = pending
+                        dropped = self.dropped_records
+                    self.logger.error("❌ Error writing %d records to %s (kept for retry, %d dropped so far): %s",
+                                      len(lines), batch_path, dropped, e)
+            return ok
+    
+    def _trim_pending(self, pending: List[bytes]):
+        """Drop the oldest queued lines beyond CYCLE_LOG_MAX_PENDING (caller holds _log_lock)"""
+        excess = len(pending) - CYCLE_LOG_MAX_PENDING
+        if excess > 0:
+            del pending[:excess]
+            self.dropped_records += excess
+    
+    def _write_lines(self, path: Path, lines: List[bytes]):
+        """Append encoded lines to path through its kept descriptor (caller holds _write_lock)"""
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._fds[path] = fd
+        data = memoryview(b''.join(lines))
+        while data:
+            data = data[os.write(fd, data):]
+    
+    def close(self):
+        """Stop the flush thread, flush pending records and close the kept file descriptors"""
+        self._flush_stop.set()
+        self._flush_now.set()
+        self._flush_wakeup.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        self.flush()
+        with self._write_lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+        _open_controllers.discard(self)
+    
+    def _flush_worker(self):
+        """
+        Flush pending records CYCLE_LOG_FLUSH_INTERVAL after they start
+        arriving, or as soon as a file has a full batch, until close()
+        """
+        while not self._flush_stop.is_set():
+            self._flush_wakeup.wait()
+            self._flush_now.wait(CYCLE_LOG_FLUSH_INTERVAL)
+            self._flush_wakeup.clear()
+            self._flush_now.clear()
+            try:
+                flushed = self.flush()
+            except Exception:
+                self.logger.exception("❌ Cycle log flush failed")
+                flushed = False
+            if not flushed:
+                # Leave the failed batch queued and try again a little later
+                self._flush_stop.wait(CYCLE_LOG_RETRY_INTERVAL)
+                self._flush_wakeup.set()
     
     def store_vault_entry(self, vault_type: str, entry_data: Dict[str, Any], 
-                         cycle_id: Optional[str] = None) -> bool:
+                         cycle_id: Optional[str] = None,
+                         timestamp_data: Optional[Dict[str, Any]] = None) -> bool:
         """
         Store entry to specified vault with ISS timestamping.
         Implements immutable_core.txt requirement for ISS timestamping all vault entries.
+        The entry is written before this returns, so True means it is on disk.
         
         Args:
             vault_type: 'a_priori' or 'a_posteriori'
             entry_data: Data to store in vault
             cycle_id: Optional cycle ID for tracking
+            timestamp_data: Optional timestamp already taken by the caller
         """
-        timestamp_data = self.get_microsecond_timestamp()
+        if timestamp_data is None:
+            timestamp_data = self.get_microsecond_timestamp()
         
         # Add ISS timestamp metadata to entry
         timestamped_entry = {
@@ -349,13 +601,14 @@ class CaleonISSController:
                      else self.a_posteriori_vault)
         
         try:
-            with open(vault_path, 'a') as f:
-                f.write(json.dumps(timestamped_entry) + '\n')
+            line = orjson.dumps(timestamped_entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+            with self._write_lock:
+                self._write_lines(vault_path, [line])
             
             # Log vault storage operation
             vault_store_record = CaleonCycleTimestamp(
                 cycle_id=cycle_id or 'NO_CYCLE',
-                cycle_type=self.current_cycle_type or 'UNKNOWN',
+                cycle_type=self._cycle_type(cycle_id) or 'UNKNOWN',
                 timestamp_microseconds=timestamp_data['timestamp_microseconds'],
                 stardate=timestamp_data['stardate'],
                 operation='vault_store',
@@ -365,65 +618,49 @@ class CaleonISSController:
             
             self._log_cycle_event(vault_store_record)
             
-            self.logger.info(f"💾 VAULT STORE [{vault_type}] - Entry stored - "
-                           f"Cycle: {cycle_id} - "
-                           f"Timestamp: {timestamp_data['timestamp_microseconds']:.3f}μs")
+            self.logger.info("💾 VAULT STORE [%s] - Entry stored - Cycle: %s - Timestamp: %.3fμs",
+                             vault_type, cycle_id, timestamp_data['timestamp_microseconds'])
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Error storing to {vault_type} vault: {e}")
+            self.logger.error("❌ Error storing to %s vault: %s", vault_type, e)
             return False
     
     def get_drift_report(self) -> Dict[str, Any]:
         """Generate drift monitoring report for zero drift expectation"""
-        try:
-            drift_samples = []
-            
-            with open(self.cycle_log_path, 'r') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                        if record.get('drift_ns') is not None:
-                            drift_samples.append(record['drift_ns'])
-                    except json.JSONDecodeError:
-                        continue
-            
-            if not drift_samples:
-                return {'status': 'no_data', 'drift_status': 'unknown'}
-            
-            avg_drift = sum(drift_samples) / len(drift_samples)
-            max_drift = max(drift_samples)
-            min_drift = min(drift_samples)
-            
-            drift_status = 'excellent' if abs(avg_drift) < 100 else 'good' if abs(avg_drift) < 500 else 'warning'
-            
-            return {
-                'status': 'calculated',
-                'drift_status': drift_status,
-                'average_drift_ns': avg_drift,
-                'max_drift_ns': max_drift,
-                'min_drift_ns': min_drift,
-                'sample_count': len(drift_samples),
-                'zero_drift_compliance': abs(avg_drift) < 1000  # Within 1μs tolerance
-            }
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error generating drift report: {e}")
-            return {'status': 'error', 'drift_status': 'unknown'}
+        with self._log_lock:
+            count = self._drift_count
+            avg_drift = self._drift_sum / count if count else 0.0
+            max_drift = self._drift_max
+            min_drift = self._drift_min
+        
+        if not count:
+            return {'status': 'no_data', 'drift_status': 'unknown'}
+        
+        drift_status = 'excellent' if abs(avg_drift) < 100 else 'good' if abs(avg_drift) < 500 else 'warning'
+        
+        return {
+            'status': 'calculated',
+            'drift_status': drift_status,
+            'average_drift_ns': avg_drift,
+            'max_drift_ns': max_drift,
+            'min_drift_ns': min_drift,
+            'sample_count': count,
+            'zero_drift_compliance': abs(avg_drift) < 1000  # Within 1μs tolerance
+        }
     
     def heartbeat(self) -> bool:
         """Enhanced heartbeat with drift monitoring"""
         try:
             drift_report = self.get_drift_report()
             
-            self.logger.info(f"💓 ISS Heartbeat - Status: {self.status} - "
-                           f"Drift: {drift_report.get('drift_status', 'unknown')} - "
-                           f"Cycles: {self.cycle_counter}")
+            self.logger.info("💓 ISS Heartbeat - Status: %s - Drift: %s - Cycles: %s",
+                             self.status, drift_report.get('drift_status', 'unknown'), self.cycle_counter)
             
             return (self.status == "healthy" and 
                    drift_report.get('zero_drift_compliance', True))
                    
         except Exception as e:
-            self.logger.error(f"❌ Heartbeat error: {e}")
+            self.logger.error("❌ Heartbeat error: %s", e)
             return False
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Logging setup shared by the ISS core components
+Routes root logging through a bounded queue and a background listener thread
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# Log records waiting for the listener thread; once full, new records below
+# WARNING are dropped rather than blocking the code that logged them
+LOG_QUEUE_SIZE = 10000
+
+# How long a WARNING-or-above record waits for room before it too is dropped;
+# bounded so a logger never hangs once the listener has stopped (e.g. at exit)
+URGENT_PUT_TIMEOUT = 1.0
+
+_log_listener = None
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted and, when the queue is full,
+    drops records below WARNING (counted in dropped) instead of blocking.
+    Warnings and errors wait up to URGENT_PUT_TIMEOUT for room first. The
+    listener's handler does the formatting.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+        # Cleared once the listener stops: nothing will make room any more
+        self.wait_for_room = True
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # The base class formats the message (and any traceback) here, on the
+        # logging thread; the listener's handler formats it anyway
+        return record
+
+    def enqueue(self, record):
+        try:
+            if record.levelno >= logging.WARNING and self.wait_for_room:
+                self.queue.put(record, timeout=URGENT_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+def dropped_log_records() -> int:
+    """Records dropped by the installed queue handler because its queue was full"""
+    return sum(h.dropped for h in logging.getLogger().handlers if isinstance(h, DroppingQueueHandler))
+
+
+def install_queue_logging():
+    """
+    Send root logging through a bounded queue drained by a background thread,
+    so log calls on hot paths are an enqueue rather than a stderr write.
+    Like logging.basicConfig(), does nothing if the root logger has handlers.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    handler = DroppingQueueHandler(log_queue)
+
+    @atexit.register
+    def _stop_listener():
+        handler.wait_for_room = False
+        _log_listener.stop()
+
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
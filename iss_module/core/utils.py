@@ -6,6 +6,9 @@ Includes stardate, Julian date calculations, and market times
 from datetime import datetime, timezone
 import time
 
+# Y2K stardate epoch (January 1, 2000, 00:00:00 UTC) as a Unix timestamp
+_STARDATE_EPOCH = datetime(2000, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()
+
 
 def get_stardate():
     """
@@ -13,11 +16,12 @@ def get_stardate():
     Using Y2K epoch (January 1, 2000, 00:00:00 UTC)
     AUTHORITY: Spruked - TNG era format revoked
     """
-    now = datetime.now(timezone.utc)
-    stardate_epoch = datetime(2000, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-    delta = now - stardate_epoch
-    stardate = delta.total_seconds() / 86400.0
-    return round(stardate, 4)
+    return stardate_at(time.time())
+
+
+def stardate_at(unix_seconds: float) -> float:
+    """Canonical stardate for a Unix timestamp, for callers that already sampled the clock"""
+    return round((unix_seconds - _STARDATE_EPOCH) / 86400.0, 4)
 
 
 def get_julian_date():
@@ -2,8 +2,10 @@ import csv
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import fields
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime
+import orjson
 from pathlib import Path
 from ..models import UnitRecord
 
@@ -105,11 +107,11 @@ class DataExporter:
                 # Create an empty file with headers if no entries
                 with open(filepath, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
-                    writer.writerow(UnitRecord.get_field_names())
+                    writer.writerow([fld.name for fld in fields(UnitRecord)])
                 return filepath
 
             # Get fieldnames from the dataclass
-            fieldnames = UnitRecord.get_field_names()
+            fieldnames = [fld.name for fld in fields(UnitRecord)]
             
             # Write CSV
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -160,7 +162,7 @@ class DataExporter:
             
             # Entries Table
             if entries:
-                field_names = UnitRecord.get_field_names()
+                field_names = [fld.name for fld in fields(UnitRecord)]
                 content_lines.append(f"| {' | '.join(field_names)} |")
                 content_lines.append(f"|{'|'.join(['---'] * len(field_names))}|")
                 for entry in entries:
@@ -178,6 +180,77 @@ class DataExporter:
             self.logger.error(f"Failed to export to Markdown: {e}")
             raise
 
+    async def stream_units_csv(self, units: AsyncIterator[UnitRecord], filepath: str) -> int:
+        """
+        Stream asset records to a CSV file one row at a time
+        
+        Args:
+            units: Async iterator of UnitRecord objects
+            filepath: Output file path
+        
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=[fld.name for fld in fields(UnitRecord)])
+            writer.writeheader()
+            async for unit in units:
+                writer.writerow(unit.to_dict())
+                count += 1
+        
+        self.logger.info(f"Streamed {count} entries to CSV: {filepath}")
+        return count
+    
+    async def stream_units_json(
+        self,
+        units: AsyncIterator[UnitRecord],
+        filepath: str,
+        lines: bool = False,
+        include_metadata: bool = True
+    ) -> int:
+        """
+        Stream asset records to a JSON document, or JSON Lines when lines=True
+        
+        The JSON document has the same {"entries": [...], "metadata": {...}}
+        layout as export_log_entries_json; metadata follows the entries so the
+        total is known by the time it is written.
+        
+        Args:
+            units: Async iterator of UnitRecord objects
+            filepath: Output file path
+            lines: Write one JSON object per line (NDJSON) instead of a document
+            include_metadata: Whether to include export metadata (JSON document only)
+        
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with open(filepath, 'wb') as f:
+            if not lines:
+                f.write(b'{"entries": [\n')
+            async for unit in units:
+                if count and not lines:
+                    f.write(b',\n')
+                f.write(orjson.dumps(unit.to_dict(), default=str))
+                if lines:
+                    f.write(b'\n')
+                count += 1
+            if not lines:
+                f.write(b'\n]')
+                if include_metadata:
+                    f.write(b', "metadata": ')
+                    f.write(orjson.dumps({
+                        'export_timestamp': datetime.now().isoformat(),
+                        'total_entries': count,
+                        'exporter': 'DALS Data Exporter v2.0',
+                        'format_version': '2.0'
+                    }))
+                f.write(b'}\n')
+        
+        self.logger.info(f"Streamed {count} entries to JSON: {filepath}")
+        return count
+
 # Convenient static class for easy usage
 class Exporters:
     """
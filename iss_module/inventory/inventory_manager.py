@@ -4,7 +4,7 @@ Manages records of digital assets, their status, and lifecycle history.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Literal
+from typing import Dict, Any, AsyncIterator, List, Optional, Literal
 from datetime import datetime, timezone
 import json
 import os
@@ -233,6 +233,35 @@ class UnitInventoryManager:
         
         return filtered_units[:limit]
 
+    async def iter_units(
+        self,
+        status: Optional[str] = None,
+        model_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False
+    ) -> AsyncIterator[UnitRecord]:
+        """
+        Yields asset records one at a time, filtering as it goes, in storage order.
+        With newest_first the records are sorted by timestamp first, which, like
+        get_units(), builds the full list before the first record is yielded.
+        """
+        status = status.upper() if status else None
+        model_id = model_id.upper() if model_id else None
+        units = self.units.values()
+        if newest_first:
+            units = sorted(units, key=lambda x: x.timestamp, reverse=True)
+        yielded = 0
+
+        for unit in units:
+            if limit is not None and yielded >= limit:
+                break
+            if status and unit.status.upper() != status:
+                continue
+            if model_id and unit.project_id.upper() != model_id:
+                continue
+            yielded += 1
+            yield unit
+
 
 @dataclass
 class LogEntry:
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+CALEON Consciousness Orchestrator Tests
+=======================================
+
+Shared verdict confirmations, the Cycle A resolution cache, pipelined Cycle B
+and Cycle B result summaries, with module calls answered by a stand-in for
+_post_json instead of live modules.
+Run with: python -m unittest test_caleon_consciousness_orchestrator
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import orjson
+
+from iss_module.core import caleon_consciousness_orchestrator as orchestrator_module
+from iss_module.core import caleon_iss_controller
+from iss_module.core.caleon_consciousness_orchestrator import CaleonConsciousnessCycleOrchestrator
+
+# Replies by endpoint path; anything else answers {'status': 'ok'}
+REPLIES = {
+    '/confirm_verdict': {'status': 'confirmed', 'confidence': 0.97},
+    '/gyro_cortical_process': {'status': 'ok', 'reaffirmation_status': 'reaffirmed'},
+    '/final_gyro_cortical': {'status': 'ok', 'final_resolution': 'RESOLVED'},
+    '/generate_output': {'status': 'ok', 'final_resolution': 'RESOLVED', 'output_length': 8},
+}
+
+VERDICT = {
+    'a_priori': {'found': True, 'status': 'verdict_found'},
+    'a_posteriori': {'found': False, 'status': 'no_verdict'},
+    'has_verdict': True,
+    'timestamp': {'timestamp_microseconds': 1.0},
+}
+
+
+class FakeModules:
+    """Stand-in for _post_json: canned replies, a log of the paths called, and optional holds"""
+
+    def __init__(self):
+        self.calls = []
+        self._holds = {}
+
+    def hold(self, path, after=0):
+        """Make calls to path past the first `after` wait until the returned event is set"""
+        gate = asyncio.Event()
+        self._holds[path] = (after, gate)
+        return gate
+
+    def count(self, path):
+        return self.calls.count(path)
+
+    async def post_json(self, url, payload):
+        self.calls.append(url.path)
+        if url.path in self._holds:
+            after, gate = self._holds[url.path]
+            if self.count(url.path) > after:
+                await gate.wait()
+        return 200, dict(REPLIES.get(url.path, {'status': 'ok'}))
+
+
+class OrchestratorTestCase(unittest.TestCase):
+    """Runs each test in a scratch directory (the ISS controller writes to ./logs and ./vaults)"""
+
+    debug_payloads = False
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.mkdtemp()
+        os.chdir(self._dir)
+        # Keep the flush thread out of the way so tests decide when records are written
+        patcher = mock.patch.object(caleon_iss_controller, 'CYCLE_LOG_FLUSH_INTERVAL', 60.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.orchestrator = CaleonConsciousnessCycleOrchestrator(debug_payloads=self.debug_payloads)
+        self.modules = FakeModules()
+        self.orchestrator._post_json = self.modules.post_json
+
+    def tearDown(self):
+        asyncio.run(self.orchestrator.aclose())
+        self.orchestrator.iss_controller.close()
+        os.chdir(self._cwd)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def cycle_log(self):
+        controller = self.orchestrator.iss_controller
+        controller.flush()
+        with open(controller.cycle_log_path, 'rb') as f:
+            return [orjson.loads(line) for line in f]
+
+
+class TestVerdictConfirmation(OrchestratorTestCase):
+
+    def test_followers_receive_the_leaders_result(self):
+        async def run():
+            gate = self.modules.hold('/confirm_verdict')
+            confirm = self.orchestrator._cochlear_verdict_confirmation
+            leader = asyncio.ensure_future(confirm('leader', VERDICT))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(confirm(f'follower-{n}', VERDICT)) for n in range(3)]
+            await asyncio.sleep(0)
+            gate.set()
+            return await leader, await asyncio.gather(*followers)
+
+        leader_result, follower_results = asyncio.run(run())
+        self.assertEqual(self.modules.count('/confirm_verdict'), 1)
+        self.assertTrue(leader_result['confirmed'])
+        for result in follower_results:
+            self.assertEqual(result, leader_result)
+            self.assertIsNot(result, leader_result)
+
+    def test_cancelled_leader_promotes_a_follower(self):
+        async def run():
+            gate = self.modules.hold('/confirm_verdict')
+            confirm = self.orchestrator._cochlear_verdict_confirmation
+            leader = asyncio.ensure_future(confirm('leader', VERDICT))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(confirm('follower', VERDICT))
+            await asyncio.sleep(0)
+            leader.cancel()
+            await asyncio.sleep(0)
+            gate.set()
+            return leader, await follower
+
+        leader, follower_result = asyncio.run(run())
+        self.assertTrue(leader.cancelled())
+        self.assertTrue(follower_result['confirmed'])
+        self.assertEqual(self.modules.count('/confirm_verdict'), 2)
+        self.assertEqual(self.orchestrator._verdict_inflight, {})
+
+
+class TestResolutionCache(OrchestratorTestCase):
+
+    def age_caches(self, seconds):
+        for cache in (self.orchestrator._resolution_cache, self.orchestrator._verdict_results):
+            for key, (stamp, value) in list(cache.items()):
+                cache[key] = (stamp - seconds, value)
+
+    def test_replay_skips_module_calls_until_the_ttl_expires(self):
+        self.orchestrator.iss_controller.store_vault_entry('a_priori', {'verdict_active': True})
+
+        first = asyncio.run(self.orchestrator.execute_cycle_a())
+        self.assertEqual(first['status'], 'completed')
+        self.assertFalse(first['resolution_cached'])
+        calls = len(self.modules.calls)
+        self.assertEqual(calls, 3)
+
+        replay = asyncio.run(self.orchestrator.execute_cycle_a())
+        self.assertTrue(replay['resolution_cached'])
+        self.assertEqual(len(self.modules.calls), calls)
+        self.assertEqual(replay['phonatory_output'], first['phonatory_output'])
+        self.assertIsNot(replay['phonatory_output'], first['phonatory_output'])
+
+        self.age_caches(orchestrator_module.RESOLUTION_CACHE_TTL)
+        expired = asyncio.run(self.orchestrator.execute_cycle_a())
+        self.assertFalse(expired['resolution_cached'])
+        self.assertEqual(len(self.modules.calls), 2 * calls)
+
+
+class TestPipelinedCycleB(OrchestratorTestCase):
+
+    def test_consumer_closing_early_ends_in_flight_cycles(self):
+        async def inputs():
+            for n in range(3):
+                yield {'input': n}
+
+        async def run():
+            # The first cycle gets through the cyclonic stage; the rest stay in flight
+            self.modules.hold('/process_synaptic_input', after=1)
+            pipeline = self.orchestrator.run_pipelined(inputs())
+            first = await pipeline.__anext__()
+            await pipeline.aclose()
+            return first
+
+        first = asyncio.run(run())
+        self.assertEqual(first['status'], 'completed')
+        self.assertFalse(self.orchestrator.consciousness_active)
+
+        records = self.cycle_log()
+        started = [r['cycle_id'] for r in records if r['operation'] == 'cycle_start']
+        ended = {r['cycle_id']: r['vault_operation'] for r in records if r['operation'] == 'cycle_end'}
+        self.assertEqual(len(started), 3)
+        self.assertEqual(set(ended), set(started))
+        self.assertEqual(ended[first['cycle_id']], 'resolution:RESOLVED')
+        for cycle_id in started[1:]:
+            self.assertEqual(ended[cycle_id], 'resolution:ABORTED: pipeline stopped')
+
+
+class TestCycleBResult(OrchestratorTestCase):
+
+    def test_stages_are_summarized(self):
+        result = asyncio.run(self.orchestrator.execute_cycle_b({'input': 'x'}))
+        self.assertEqual(result['status'], 'completed')
+        for key in CaleonConsciousnessCycleOrchestrator._CYCLE_B_STAGES:
+            self.assertEqual(set(result[key]), {'status', 'sha', 'size'})
+        self.assertEqual(result['dual_cochlear_processing']['status'], 'synchronized')
+        self.assertEqual(result['core_reasoning']['status'], 'processed')
+        self.assertEqual(result['phonatory_output']['final_resolution'], 'RESOLVED')
+
+
+class TestCycleBDebugPayloads(OrchestratorTestCase):
+
+    debug_payloads = True
+
+    def test_stages_are_kept_in_full(self):
+        result = asyncio.run(self.orchestrator.execute_cycle_b({'input': 'x'}))
+        self.assertEqual(result['status'], 'completed')
+        self.assertEqual(result['dual_cochlear_processing']['processor_1'], {'status': 'ok'})
+        self.assertEqual(set(result['core_reasoning']['core_results']),
+                         {'anterior_helix', 'posterior_helix', 'echostack', 'echo_ripple'})
+        self.assertIn('distribution_payload', result['synaptic_distribution'])
+
+
+if __name__ == '__main__':
+    unittest.main()
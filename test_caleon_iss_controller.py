@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+CALEON ISS Controller Tests
+===========================
+
+Behaviour of the controller's buffered audit trail and vault writes.
+Run with: python -m unittest test_caleon_iss_controller
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import orjson
+
+from iss_module.core import caleon_iss_controller
+from iss_module.core.caleon_iss_controller import CaleonISSController
+
+
+def read_records(path):
+    with open(path, 'rb') as f:
+        return [orjson.loads(line) for line in f]
+
+
+class ControllerTestCase(unittest.TestCase):
+    """Runs each test in a scratch directory (the controller writes to ./logs and ./vaults)"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.mkdtemp()
+        os.chdir(self._dir)
+        # Keep the flush thread out of the way so tests decide when records are written
+        patcher = mock.patch.object(caleon_iss_controller, 'CYCLE_LOG_FLUSH_INTERVAL', 60.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.controller = CaleonISSController()
+
+    def tearDown(self):
+        self.controller.close()
+        os.chdir(self._cwd)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class TestCycleLogBuffering(ControllerTestCase):
+
+    def test_records_are_buffered_until_flush(self):
+        cycle_id = self.controller.start_cycle('A')
+        self.assertFalse(self.controller.cycle_log_path.exists())
+
+        self.assertTrue(self.controller.flush())
+        records = read_records(self.controller.cycle_log_path)
+        self.assertEqual([r['cycle_id'] for r in records], [cycle_id])
+        self.assertEqual(records[0]['operation'], 'cycle_start')
+
+    def test_full_batch_is_written_by_the_flush_thread(self):
+        writers = set()
+        real_write = os.write
+
+        def recording_write(fd, data):
+            writers.add(threading.get_ident())
+            return real_write(fd, data)
+
+        with mock.patch.object(caleon_iss_controller.os, 'write', recording_write):
+            for _ in range(caleon_iss_controller.CYCLE_LOG_BATCH):
+                self.controller.start_cycle('B')
+            self.assertNotIn(threading.get_ident(), writers)
+            # The flush interval is 60s here, so only the full batch wakes the thread
+            deadline = time.monotonic() + 2.0
+            while not writers and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(writers, {self.controller._flush_thread.ident})
+        self.assertEqual(len(read_records(self.controller.cycle_log_path)),
+                         caleon_iss_controller.CYCLE_LOG_BATCH)
+
+    def test_close_flushes_pending_records(self):
+        cycle_id = self.controller.start_cycle('A')
+        self.controller.end_cycle(cycle_id)
+        self.controller.close()
+
+        operations = [r['operation'] for r in read_records(self.controller.cycle_log_path)]
+        self.assertEqual(operations, ['cycle_start', 'cycle_end'])
+        self.assertFalse(self.controller._flush_thread.is_alive())
+
+    def test_failed_write_is_kept_and_retried_in_order(self):
+        first = self.controller.start_cycle('A')
+        with mock.patch.object(caleon_iss_controller.os, 'write', side_effect=OSError("disk full")):
+            self.assertFalse(self.controller.flush())
+        second = self.controller.start_cycle('A')
+
+        self.assertTrue(self.controller.flush())
+        cycle_ids = [r['cycle_id'] for r in read_records(self.controller.cycle_log_path)]
+        self.assertEqual(cycle_ids, [first, second])
+
+    def test_pending_lines_are_capped_oldest_first(self):
+        with mock.patch.object(caleon_iss_controller, 'CYCLE_LOG_MAX_PENDING', 3), \
+                mock.patch.object(caleon_iss_controller.os, 'write', side_effect=OSError("read-only")):
+            cycle_ids = [self.controller.start_cycle('A') for _ in range(2)]
+            self.assertFalse(self.controller.flush())
+            cycle_ids += [self.controller.start_cycle('A') for _ in range(3)]
+
+        self.assertEqual(self.controller.dropped_records, 2)
+        self.assertTrue(self.controller.flush())
+        self.assertEqual([r['cycle_id'] for r in read_records(self.controller.cycle_log_path)],
+                         cycle_ids[2:])
+
+    def test_flush_thread_survives_errors(self):
+        with mock.patch.object(caleon_iss_controller, 'CYCLE_LOG_RETRY_INTERVAL', 0.01), \
+                mock.patch.object(CaleonISSController, 'flush', side_effect=RuntimeError("boom")):
+            self.controller._flush_wakeup.set()
+            self.controller._flush_stop.wait(0.1)
+            self.assertTrue(self.controller._flush_thread.is_alive())
+
+
+class TestVaultStore(ControllerTestCase):
+
+    def test_store_is_on_disk_when_it_returns(self):
+        self.assertTrue(self.controller.store_vault_entry('a_priori', {'verdict_active': True}))
+        entries = read_records(self.controller.a_priori_vault)
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0]['verdict_active'])
+        self.assertTrue(self.controller.check_vault_verdicts('CALEON_TEST')['a_priori']['found'])
+
+    def test_cached_scan_is_not_shared_with_callers(self):
+        self.controller.store_vault_entry('a_priori', {'verdict_active': True})
+        self.controller.check_vault_verdicts('CALEON_TEST')['a_priori']['found'] = False
+        self.assertTrue(self.controller.check_vault_verdicts('CALEON_TEST')['a_priori']['found'])
+
+    def test_store_reports_write_failure(self):
+        with mock.patch.object(caleon_iss_controller.os, 'write', side_effect=OSError("disk full")):
+            self.assertFalse(self.controller.store_vault_entry('a_posteriori', {'verdict_active': True}))
+
+
+class TestCycleTracking(ControllerTestCase):
+
+    def test_cycle_counter_and_duration(self):
+        cycle_id = self.controller.start_cycle('A')
+        time.sleep(0.001)
+        result = self.controller.end_cycle(cycle_id)
+        self.assertEqual(self.controller.cycle_counter, 1)
+        self.assertGreater(result['duration_ms'], 0.0)
+
+    def test_overlapping_cycles_keep_their_own_type(self):
+        cycle_a = self.controller.start_cycle('A')
+        cycle_b = self.controller.start_cycle('B')
+        self.controller.harmonizer_ping_confirmation(cycle_a, {'status': 'ok'})
+        self.controller.end_cycle(cycle_a)
+        self.controller.end_cycle(cycle_b)
+        self.controller.flush()
+
+        types = {(r['cycle_id'], r['operation']): r['cycle_type']
+                 for r in read_records(self.controller.cycle_log_path)}
+        self.assertEqual(types[(cycle_a, 'harmonizer_ping')], 'A')
+        self.assertEqual(types[(cycle_a, 'cycle_end')], 'A')
+        self.assertEqual(types[(cycle_b, 'cycle_end')], 'B')
+        self.assertIsNone(self.controller.current_cycle_id)
+
+
+class TestDriftReport(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.mkdtemp()
+        os.chdir(self._dir)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def test_report_covers_only_this_instance(self):
+        os.makedirs('logs')
+        with open(os.path.join('logs', 'caleon_cycle_timestamps.jsonl'), 'wb') as f:
+            f.write(b'{"drift_ns": 5.0e6}\n{broken\n')
+
+        controller = CaleonISSController()
+        try:
+            self.assertEqual(controller.get_drift_report()['status'], 'no_data')
+            controller.start_cycle('A')
+            report = controller.get_drift_report()
+            self.assertEqual(report['sample_count'], 1)
+        finally:
+            controller.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
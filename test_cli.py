@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+CLI Tests
+=========
+
+Runs `iss` subcommands through the console-script entry point declared in setup.py.
+Run with: python -m unittest test_cli
+"""
+
+import contextlib
+import csv
+import importlib
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from iss_module import cli
+from iss_module.inventory.inventory_manager import UnitInventoryManager
+from iss_module.models import UnitRecord
+
+
+def load_entry_point(name):
+    """Resolve a console_scripts entry from setup.py to its callable"""
+    setup_py = (Path(__file__).parent / 'setup.py').read_text(encoding='utf-8')
+    target = re.search(rf'"{re.escape(name)}=([\w.]+):(\w+)"', setup_py)
+    module = importlib.import_module(target.group(1))
+    return getattr(module, target.group(2))
+
+
+class TestExportCommand(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._dir, True)
+
+        with open(os.path.join(self._dir, 'dals_inventory.jsonl'), 'wb') as f:
+            for n in range(3):
+                record = UnitRecord(id=f'ASSET-{n}', asset_id=f'ASSET-{n}', project_id='CORE-API',
+                                    timestamp=f'2026-01-0{n + 1}T00:00:00+00:00', status='DEPLOYED')
+                f.write(orjson.dumps(record.to_dict()) + b'\n')
+
+        # Point the shared inventory at the scratch vault for this test only
+        patcher = mock.patch.object(cli, '_INVENTORY', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        data_dir = mock.patch.object(UnitInventoryManager, '_get_default_data_dir', return_value=self._dir)
+        data_dir.start()
+        self.addCleanup(data_dir.stop)
+
+    def run_iss(self, *argv):
+        main = load_entry_point('iss')
+        out = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['iss', *argv]), contextlib.redirect_stdout(out):
+            main()
+        return out.getvalue()
+
+    def test_entry_point_is_the_cli_main(self):
+        self.assertIs(load_entry_point('iss'), cli.main)
+
+    def test_export_json(self):
+        output = os.path.join(self._dir, 'export.json')
+        printed = self.run_iss('export', 'json', '--output', output)
+
+        self.assertIn('Exported 3 assets', printed)
+        with open(output, 'rb') as f:
+            document = orjson.loads(f.read())
+        self.assertEqual([e['asset_id'] for e in document['entries']], ['ASSET-0', 'ASSET-1', 'ASSET-2'])
+        self.assertEqual(document['metadata']['total_entries'], 3)
+
+    def test_export_csv(self):
+        output = os.path.join(self._dir, 'export.csv')
+        self.run_iss('export', 'csv', '-o', output)
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({r['status'] for r in rows}, {'DEPLOYED'})
+
+    def test_export_reuses_loaded_inventory(self):
+        self.run_iss('export', 'ndjson', '-o', os.path.join(self._dir, 'first.ndjson'))
+        inventory = cli._INVENTORY
+        with mock.patch.object(UnitInventoryManager, 'load_records') as load_records:
+            self.run_iss('status')
+        load_records.assert_not_called()
+        self.assertIs(cli._INVENTORY, inventory)
+
+
+if __name__ == '__main__':
+    unittest.main()
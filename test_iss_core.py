@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+ISS Core Tests
+==============
+
+Module registration, heartbeat caching, shutdown and queue logging behaviour of the ISS core.
+Run with: python -m unittest test_iss_core
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from iss_module.core.ISS import ISS, HB_WARN_FIRST, HB_WARN_EVERY
+from iss_module.core.logging_setup import DroppingQueueHandler
+
+
+class SyncModule:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.heartbeats = 0
+        self.stopped = False
+
+    def heartbeat(self):
+        self.heartbeats += 1
+        return self.healthy
+
+    def shutdown(self):
+        self.stopped = True
+
+
+class AsyncModule:
+    def __init__(self, healthy=True, delay=0.0):
+        self.healthy = healthy
+        self.delay = delay
+        self.stopped = False
+
+    async def heartbeat(self):
+        await asyncio.sleep(self.delay)
+        return self.healthy
+
+    async def shutdown(self):
+        self.stopped = True
+
+
+class ISSTestCase(unittest.TestCase):
+    """Runs each test in a scratch directory (ISS creates ./logs on first use)"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._dir = tempfile.mkdtemp()
+        os.chdir(self._dir)
+        self.iss = ISS()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class TestModuleRegistry(ISSTestCase):
+
+    def test_assigning_into_modules_registers_the_module(self):
+        module = SyncModule(False)
+        self.iss.modules["m"] = module
+        self.assertIs(self.iss.modules["m"], module)
+        self.assertFalse(self.iss.heartbeat())
+        self.assertEqual(module.heartbeats, 1)
+
+        del self.iss.modules["m"]
+        self.assertNotIn("m", self.iss.modules)
+        self.assertTrue(self.iss.heartbeat())
+        with self.assertRaises(KeyError):
+            del self.iss.modules["m"]
+
+    def test_replacing_modules_reregisters_everything(self):
+        self.iss.register_module("old", SyncModule(False))
+        self.iss.modules = {"new": SyncModule(True)}
+        self.assertEqual(list(self.iss.modules), ["new"])
+        self.assertTrue(self.iss.heartbeat())
+
+
+class TestHeartbeat(ISSTestCase):
+
+    def test_unhealthy_module_fails_heartbeat(self):
+        self.iss.register_module("ok", SyncModule(True))
+        self.iss.register_module("bad", SyncModule(False))
+        self.assertFalse(self.iss.heartbeat())
+        self.assertFalse(self.iss.heartbeat_bool())
+
+    def test_result_is_cached_within_ttl(self):
+        module = SyncModule(True)
+        self.iss.register_module("m", module)
+        self.assertTrue(self.iss.heartbeat())
+        module.healthy = False
+        self.assertTrue(self.iss.heartbeat())
+        self.assertEqual(module.heartbeats, 1)
+
+    def test_cache_expires_after_ttl(self):
+        module = SyncModule(True)
+        self.iss.register_module("m", module)
+        self.iss.status_ttl = 0.01
+        self.assertTrue(self.iss.heartbeat())
+        module.healthy = False
+        time.sleep(0.02)
+        self.assertFalse(self.iss.heartbeat())
+
+    def test_registering_invalidates_cache(self):
+        self.iss.register_module("ok", SyncModule(True))
+        self.assertTrue(self.iss.heartbeat())
+        self.iss.register_module("bad", SyncModule(False))
+        self.assertFalse(self.iss.heartbeat())
+        self.iss.unregister_module("bad")
+        self.assertTrue(self.iss.heartbeat())
+
+    def test_failure_warnings_are_sampled(self):
+        self.iss.register_module("bad", SyncModule(False))
+        self.iss.status_ttl = 0
+        with self.assertLogs("iss_module.core.ISS", level="WARNING") as logs:
+            for _ in range(HB_WARN_EVERY + 1):
+                self.iss.heartbeat()
+        self.assertEqual(len(logs.records), HB_WARN_FIRST + 1)
+
+    def test_sync_heartbeat_runs_async_modules_without_a_loop(self):
+        self.iss.register_module("a", AsyncModule(False))
+        self.assertFalse(self.iss.heartbeat())
+
+
+class TestHeartbeatAsync(ISSTestCase):
+
+    def test_async_heartbeats_run_concurrently(self):
+        for name in ("a", "b", "c"):
+            self.iss.register_module(name, AsyncModule(True, delay=0.1))
+        self.iss.register_module("sync", SyncModule(True))
+
+        start = time.perf_counter()
+        healthy = asyncio.run(self.iss.heartbeat_async())
+        self.assertTrue(healthy)
+        self.assertLess(time.perf_counter() - start, 0.25)
+
+    def test_in_loop_heartbeat_serves_async_result(self):
+        self.iss.register_module("a", AsyncModule(True))
+        self.iss.register_module("sync", SyncModule(True))
+
+        async def poll():
+            # Nothing probed yet: the async module is unchecked, and a probe starts
+            first = self.iss.heartbeat_bool()
+            await self.iss._heartbeat_refresh
+            return first, self.iss.heartbeat(), self.iss.get_status()["heartbeat_healthy"]
+
+        self.assertEqual(asyncio.run(poll()), (False, True, True))
+
+    def test_in_loop_unchecked_warnings_are_sampled(self):
+        self.iss.register_module("a", AsyncModule(True, delay=1.0))
+        self.iss.status_ttl = 0
+
+        async def poll():
+            for _ in range(HB_WARN_EVERY + 1):
+                self.assertFalse(self.iss.heartbeat())
+            self.iss._heartbeat_refresh.cancel()
+
+        with self.assertLogs("iss_module.core.ISS", level="WARNING") as logs:
+            asyncio.run(poll())
+        self.assertEqual(len(logs.records), HB_WARN_FIRST + 1)
+
+    def test_async_heartbeat_exception_is_unhealthy(self):
+        class Broken:
+            async def heartbeat(self):
+                raise RuntimeError("probe failed")
+
+        self.iss.register_module("broken", Broken())
+        self.assertFalse(asyncio.run(self.iss.heartbeat_async()))
+
+
+class TestShutdown(ISSTestCase):
+
+    def test_shutdown_stops_sync_and_async_modules(self):
+        sync_module, async_module = SyncModule(), AsyncModule()
+        self.iss.register_module("sync", sync_module)
+        self.iss.register_module("async", async_module)
+
+        asyncio.run(self.iss.shutdown())
+        self.assertTrue(sync_module.stopped)
+        self.assertTrue(async_module.stopped)
+        self.assertEqual(self.iss.status, "shutdown")
+        self.assertFalse(self.iss.heartbeat())
+
+
+class TestStatus(ISSTestCase):
+
+    def test_status_reflects_registered_modules(self):
+        self.iss.register_module("m", SyncModule(True))
+        status = self.iss.get_status()
+        self.assertIsInstance(status, dict)
+        self.assertEqual(status["modules_loaded"], 1)
+        self.assertEqual(status["module_list"], ["m"])
+        self.assertTrue(status["heartbeat_healthy"])
+        self.assertEqual(status["startup_time"], self.iss.startup_time)
+
+    def test_status_dict_is_a_copy(self):
+        self.iss.get_status()["status"] = "tampered"
+        self.assertEqual(self.iss.get_status()["status"], "healthy")
+
+    def test_status_snapshot_is_typed_and_cached(self):
+        self.iss.register_module("m", SyncModule(True))
+        snapshot = self.iss.status_snapshot()
+        self.assertEqual(snapshot.module_list, ("m",))
+        self.assertIs(self.iss.status_snapshot(), snapshot)
+        self.assertEqual(snapshot._asdict()["status"], self.iss.get_status()["status"])
+
+
+class TestQueueLogging(unittest.TestCase):
+
+    def record(self, level):
+        return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+    def test_full_queue_drops_and_counts_info_records(self):
+        handler = DroppingQueueHandler(queue.Queue(1))
+        handler.handle(self.record(logging.INFO))
+        handler.handle(self.record(logging.INFO))
+        handler.handle(self.record(logging.DEBUG))
+        self.assertEqual(handler.dropped, 2)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+    def test_full_queue_waits_for_room_for_warnings(self):
+        handler = DroppingQueueHandler(queue.Queue(1))
+        handler.handle(self.record(logging.INFO))
+        threading.Timer(0.05, handler.queue.get_nowait).start()
+        handler.handle(self.record(logging.ERROR))
+        self.assertEqual(handler.dropped, 0)
+        self.assertEqual(handler.queue.get_nowait().levelno, logging.ERROR)
+
+    def test_warning_gives_up_when_nothing_drains_the_queue(self):
+        handler = DroppingQueueHandler(queue.Queue(1))
+        handler.handle(self.record(logging.INFO))
+        with mock.patch("iss_module.core.logging_setup.URGENT_PUT_TIMEOUT", 0.01):
+            handler.handle(self.record(logging.CRITICAL))
+        self.assertEqual(handler.dropped, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+WebSocket Stream Tests
+======================
+
+Per-client outbound queues, topic fan-out and zlib frames of the telemetry
+connection manager (on fake sockets), and the /ws/telemetry endpoint's
+handling of text and binary client frames (through Starlette's TestClient).
+Run with: python -m unittest test_ws_stream
+"""
+
+import asyncio
+import unittest
+import zlib
+from unittest import mock
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from iss_module.api import ws_stream
+from iss_module.api.ws_stream import TelemetryConnectionManager, ws_router
+
+
+class FakeSocket:
+    """Just enough of a WebSocket for the connection manager; stalled sockets never finish a send"""
+
+    def __init__(self, subprotocols=(), stalled=False):
+        self.scope = {'subprotocols': list(subprotocols)}
+        self.stalled = stalled
+        self.subprotocol = None
+        self.close_code = None
+        self.frames = []
+
+    async def accept(self, subprotocol=None):
+        self.subprotocol = subprotocol
+
+    async def send_text(self, data):
+        await self._send(data)
+
+    async def send_bytes(self, data):
+        await self._send(data)
+
+    async def _send(self, frame):
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.frames.append(frame)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+    def messages(self):
+        return [orjson.loads(zlib.decompress(f) if isinstance(f, bytes) else f) for f in self.frames]
+
+
+async def settle():
+    """Let writer tasks drain whatever is queued"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManager(unittest.TestCase):
+
+    def run_with_manager(self, scenario):
+        async def run():
+            manager = TelemetryConnectionManager()
+            try:
+                return await scenario(manager)
+            finally:
+                for websocket in list(manager.active_connections):
+                    manager.disconnect(websocket)
+        return asyncio.run(run())
+
+    def test_full_queue_evicts_the_client(self):
+        async def scenario(manager):
+            slow, healthy = FakeSocket(stalled=True), FakeSocket()
+            await manager.connect(slow)
+            await manager.connect(healthy)
+            for n in range(5):
+                await manager.send_status_update({'n': n})
+                await settle()
+            return slow, healthy, manager
+
+        with mock.patch.object(ws_stream, 'CLIENT_QUEUE_SIZE', 2):
+            slow, healthy, manager = self.run_with_manager(scenario)
+        self.assertNotIn(slow, manager.outbound_queues)
+        self.assertEqual(slow.close_code, 1013)
+        self.assertEqual([m['data']['n'] for m in healthy.messages()], [0, 1, 2, 3, 4])
+
+    def test_telemetry_reaches_only_subscribers(self):
+        async def scenario(manager):
+            certsig, caleon, everything = FakeSocket(), FakeSocket(), FakeSocket()
+            for websocket in (certsig, caleon, everything):
+                await manager.connect(websocket)
+            await manager.subscribe(certsig, ['certsig'])
+            await manager.subscribe(caleon, ['caleon'])
+            await settle()
+            for websocket in (certsig, caleon, everything):
+                websocket.frames.clear()
+
+            await manager.broadcast_telemetry('certsig', {'value': 1})
+            await settle()
+            return certsig, caleon, everything
+
+        certsig, caleon, everything = self.run_with_manager(scenario)
+        self.assertEqual(caleon.frames, [])
+        for websocket in (certsig, everything):
+            [message] = websocket.messages()
+            self.assertEqual(message['type'], 'telemetry_update')
+            self.assertEqual(message['module'], 'certsig')
+            self.assertEqual(message['data'], {'value': 1})
+
+    def test_zlib_client_receives_compressed_payload(self):
+        async def scenario(manager):
+            compressed, plain = FakeSocket(subprotocols=[ws_stream.ZLIB_SUBPROTOCOL]), FakeSocket()
+            await manager.connect(compressed)
+            await manager.connect(plain)
+            await manager.broadcast_telemetry('iss', {'blob': 'x' * ws_stream.COMPRESS_MIN_SIZE})
+            await manager.broadcast_telemetry('iss', {'small': True})
+            await settle()
+            return compressed, plain
+
+        compressed, plain = self.run_with_manager(scenario)
+        self.assertEqual(compressed.subprotocol, ws_stream.ZLIB_SUBPROTOCOL)
+        large, small = compressed.frames
+        self.assertIsInstance(large, bytes)
+        self.assertEqual(zlib.decompress(large).decode(), plain.frames[0])
+        self.assertEqual(small, plain.frames[1])
+
+
+class TestTelemetryEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(ws_router)
+        self.client = TestClient(app)
+
+    def test_text_and_binary_frames_are_both_handled(self):
+        with self.client.websocket_connect('/ws/telemetry') as websocket:
+            self.assertEqual(websocket.receive_json()['type'], 'welcome')
+
+            websocket.send_text('{"action": "ping"}')
+            self.assertEqual(websocket.receive_json()['type'], 'pong')
+
+            websocket.send_bytes(b'{"action": "subscribe", "modules": ["iss"]}')
+            reply = websocket.receive_json()
+            self.assertEqual(reply['type'], 'subscription_update')
+            self.assertEqual(reply['subscribed_modules'], ['iss'])
+
+            websocket.send_bytes(b'{not json')
+            self.assertEqual(websocket.receive_json()['message'], 'Invalid JSON message')
+
+
+if __name__ == '__main__':
+    unittest.main()